@@ -3,6 +3,16 @@ ManuX Wealth OS - Android Version
 Main entry point using KivyMD for Material Design UI
 """
 
+import os
+import sys
+
+# Shared engine modules (simulation_engine.py, ...) live in the repository root.
+# When running from source they are imported from there; the APK build copies them next to main.py.
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if os.path.exists(os.path.join(_REPO_ROOT, "simulation_engine.py")) and _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from kivy.clock import Clock
 from kivy.lang import Builder
 from kivy.core.window import Window
 from kivy.uix.screenmanager import ScreenManager, SlideTransition
@@ -27,9 +37,14 @@ class ManuXWealthOS(MDApp):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.currency_api = CurrencyAPI()
+        self.currency_api = CurrencyAPI(
+            cache_path=os.path.join(self.user_data_dir, "ecb_rates.json"),
+            history_dir=os.path.join(self.user_data_dir, "ecb_history"),
+        )
         self.currency = "EUR"
-        self.exchange_rates = {"EUR": 1.0, "USD": 1.05, "RON": 4.98, "CAD": 1.45, "GBP": 0.86}
+        # Last saved ECB snapshot (or built-in defaults) until the first refresh completes
+        self.exchange_rates = dict(self.currency_api.rates)
+        self._rate_callbacks = []
     
     def build(self):
         # Theme
@@ -64,14 +79,35 @@ class ManuXWealthOS(MDApp):
         self.sm.transition.direction = 'left'
         self.sm.current = screen_name
     
-    def refresh_rates(self):
-        """Refresh exchange rates from ECB"""
-        try:
-            self.exchange_rates = self.currency_api.get_rates()
-            return True
-        except:
-            return False
-
+    def on_start(self):
+        # Never block startup on the network: refresh in the background only if stale
+        if not self.currency_api.is_fresh:
+            self.refresh_rates()
+    
+    def refresh_rates(self, callback=None):
+        """Refresh exchange rates from ECB without blocking the UI
+        
+        The request runs on a worker thread; repeated calls while it is in
+        flight are coalesced into that single request. Results are applied
+        on the Kivy main thread via Clock.schedule_once.
+        
+        Args:
+            callback: optional callback(success) called on the main thread
+            
+        Returns:
+            True if a new request was started, False if one was already running
+        """
+        if callback:
+            self._rate_callbacks.append(callback)
+        return self.currency_api.refresh_async(
+            lambda rates, error: Clock.schedule_once(lambda dt: self._on_rates(rates, error))
+        )
+    
+    def _on_rates(self, rates, error):
+        self.exchange_rates = rates
+        callbacks, self._rate_callbacks = self._rate_callbacks, []
+        for callback in callbacks:
+            callback(error is None)
 
 if __name__ == '__main__':
     ManuXWealthOS().run()
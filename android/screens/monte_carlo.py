@@ -14,7 +14,8 @@ from kivymd.uix.scrollview import MDScrollView
 from kivymd.uix.list import MDList, MDListItem, MDListItemHeadlineText, MDListItemSupportingText
 from kivy.metrics import dp
 from kivy.clock import Clock
-import random
+
+from simulation_engine import run_monte_carlo
 
 
 class MonteCarloScreen(MDScreen):
@@ -113,27 +114,16 @@ class MonteCarloScreen(MDScreen):
             n_sims = int(self.sims_input.text or 1000)
             rate = 0.07
             
-            total_invested = capital + monthly * 12 * years
-            results = []
-            
-            for i in range(n_sims):
-                total = capital
-                for year in range(years):
-                    yearly_return = random.gauss(rate, volatility)
-                    total = total * (1 + yearly_return) + monthly * 12
-                results.append(total)
-                
-                if i % 100 == 0:
-                    self.progress.value = i / n_sims
-            
+            self.progress.value = 0
+            # Child processes are not reliable on Android - keep the run in-process
+            result = run_monte_carlo(capital, monthly, years, rate, volatility, n_sims, workers=1)
             self.progress.value = 1
-            results.sort()
             
-            p10 = results[int(n_sims * 0.1)]
-            p50 = results[int(n_sims * 0.5)]
-            p90 = results[int(n_sims * 0.9)]
-            mean_val = sum(results) / n_sims
-            success_rate = sum(1 for r in results if r > total_invested) / n_sims * 100
+            p10 = result.percentiles[10]
+            p50 = result.percentiles[50]
+            p90 = result.percentiles[90]
+            mean_val = result.mean
+            success_rate = result.success_rate
             
             self.p10_label.text = f"P10 (Pesimist): € {p10:,.0f}"
             self.p50_label.text = f"P50 (Median): € {p50:,.0f}"
@@ -1,64 +1,69 @@
 """
 Currency API using ECB (European Central Bank)
-Free, no API key required, works on Android
+Free, no API key required, works on Android.
+Backed by the shared rate_service module (TTL cache, on-disk snapshot,
+conditional requests), which the build copies next to main.py.
+Historical conversions use the shared rate_history store (date x currency
+matrix, memory-mapped), loaded on first use.
 """
 
-import requests
-import xml.etree.ElementTree as ET
-from typing import Dict
+from typing import Callable, Dict
+
+from rate_service import RateService
 
 
 class CurrencyAPI:
     """Fetch exchange rates from European Central Bank"""
     
-    ECB_URL = "https://www.ecb.europa.eu/stats/eurofxref/eurofxref-daily.xml"
-    
-    def __init__(self):
-        self.rates = {"EUR": 1.0}
-        self.last_update = None
+    def __init__(self, cache_path: str = None, base_url: str = None, history_dir: str = None):
+        self.service = RateService(base_url=base_url, cache_path=cache_path)
+        self.base_url = base_url
+        self.history_dir = history_dir
+        self._history = None
+        snapshot = self.service.snapshot
+        self.rates = dict(snapshot.rates)
+        self.last_update = snapshot.fetched_at or None
     
     def get_rates(self) -> Dict[str, float]:
-        """Fetch latest exchange rates from ECB
+        """Latest exchange rates from ECB
+        
+        Only contacts the ECB when the cached snapshot is older than the TTL;
+        otherwise (and when offline) returns the last good snapshot, or the
+        built-in defaults if there has never been one.
         
         Returns:
             Dict with currency codes as keys and rates as values
             All rates are relative to EUR (EUR = 1.0)
         """
-        try:
-            response = requests.get(self.ECB_URL, timeout=10)
-            response.raise_for_status()
-            
-            # Parse XML
-            root = ET.fromstring(response.content)
-            
-            # ECB XML namespace
-            namespaces = {
-                'gesmes': 'http://www.gesmes.org/xml/2002-08-01',
-                'eurofxref': 'http://www.ecb.int/vocabulary/2002-08-01/eurofxref'
-            }
-            
-            self.rates = {"EUR": 1.0}
-            
-            # Find all Cube elements with currency attribute
-            for cube in root.findall('.//eurofxref:Cube[@currency]', namespaces):
-                currency = cube.get('currency')
-                rate = float(cube.get('rate'))
-                self.rates[currency] = rate
-            
-            return self.rates
+        self.rates = self.service.get_rates()
+        self.last_update = self.service.snapshot.fetched_at or None
+        return self.rates
+    
+    def refresh_async(self, callback: Callable = None) -> bool:
+        """Refresh rates on a worker thread without blocking the caller
+        
+        Concurrent calls share one in-flight request; every callback is
+        invoked once it finishes. The callback runs on the worker thread,
+        so UI code must hop back to its own thread (Clock.schedule_once).
+        
+        Args:
+            callback: callback(rates, error), error is None on success
             
-        except Exception as e:
-            print(f"Error fetching ECB rates: {e}")
-            # Return default rates if API fails
-            return {
-                "EUR": 1.0,
-                "USD": 1.05,
-                "RON": 4.98,
-                "GBP": 0.86,
-                "CHF": 0.94,
-                "CAD": 1.45,
-                "JPY": 158.0
-            }
+        Returns:
+            True if a new request was started, False if joined a running one
+        """
+        def on_done(snapshot, error):
+            self.rates = dict(snapshot.rates)
+            self.last_update = snapshot.fetched_at or None
+            if callback:
+                callback(self.rates, error)
+        
+        return self.service.refresh_async(on_done)
+    
+    @property
+    def is_fresh(self) -> bool:
+        """True while the cached rates are within the TTL"""
+        return self.service.is_fresh()
     
     def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
         """Convert amount between currencies
@@ -70,23 +75,62 @@ class CurrencyAPI:
             
         Returns:
             Converted amount
+            
+        Raises:
+            ValueError: if either currency is not quoted by the ECB
         """
-        if not self.rates:
-            self.get_rates()
-        
         # Convert to EUR first, then to target
-        if from_currency == "EUR":
-            eur_amount = amount
-        else:
-            eur_amount = amount / self.rates.get(from_currency, 1.0)
-        
-        if to_currency == "EUR":
-            return eur_amount
-        else:
-            return eur_amount * self.rates.get(to_currency, 1.0)
+        return amount / self.get_rate(from_currency) * self.get_rate(to_currency)
     
     def get_rate(self, currency: str) -> float:
         """Get rate for a single currency (relative to EUR)"""
         if not self.rates:
             self.get_rates()
-        return self.rates.get(currency, 1.0)
+        try:
+            return self.rates[currency]
+        except KeyError:
+            raise ValueError(f"Unknown currency: {currency}") from None
+    
+    @property
+    def history(self):
+        """Historical rate store (imports numpy on first use)"""
+        if self._history is None:
+            from rate_history import RateHistory
+            self._history = RateHistory(store_dir=self.history_dir, base_url=self.base_url)
+        return self._history
+    
+    def update_history(self, full: bool = None) -> int:
+        """Download the ECB history into the local store (blocking, use a thread)
+        
+        Returns:
+            Number of days in the store
+        """
+        history = self.history
+        days = history.update(full)
+        snapshot = self.service.snapshot
+        if snapshot.date and snapshot.source != "fallback":
+            history.add_snapshot(snapshot.date, snapshot.rates)
+            history.save()
+        return days
+    
+    def convert_series(self, amounts, dates, from_currency: str, to_currency: str):
+        """Convert a whole column of amounts in one vectorized call
+        
+        Args:
+            amounts: Sequence or numpy array of amounts
+            dates: Matching dates (each amount at its day's ECB rate),
+                or None to use the current rates
+            from_currency: Source currency code
+            to_currency: Target currency code
+            
+        Returns:
+            numpy array of converted amounts
+            
+        Raises:
+            ValueError: for unknown currencies or dates outside the history
+        """
+        import numpy as np
+        
+        if dates is None:
+            return np.asarray(amounts, dtype=float) * (self.get_rate(to_currency) / self.get_rate(from_currency))
+        return self.history.convert_series(amounts, dates, from_currency, to_currency)
@@ -0,0 +1,247 @@
+"""
+ManuX Wealth OS - Export Proiecții
+- CSV în flux (bucăți tamponate, gzip opțional, separator zecimal configurabil)
+- raport PDF complet, paginat, cu sumar și grafic vectorial (reportlab)
+Ambele sunt apelabile dintr-un thread de lucru prin BackgroundTask.
+"""
+
+import csv
+import gzip
+import io
+import math
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator
+
+
+CSV_HEADER = ["Perioadă", "Sold", "Depozite", "Retrageri", "Dobândă", "Valoare Reală"]
+PDF_HEADER = ["Perioadă", "Sold", "Depozite", "Retrageri", "Dobândă", "Val. Reală"]
+CHUNK_ROWS = 2000
+PDF_ROWS_PER_PAGE = 45      # estimare pentru progres (A4, font 8)
+PDF_CHART_POINTS = 400      # seriile mai lungi sunt eșantionate pentru grafic
+
+
+class ExportCancelled(Exception):
+    """Exportul a fost oprit la cererea utilizatorului"""
+
+
+def system_decimal_point() -> str:
+    """Separatorul zecimal al localizării sistemului ("." dacă nu se poate determina).
+
+    Schimbă temporar LC_NUMERIC, deci se apelează pe thread-ul Tk, înainte de export.
+    """
+    import locale
+
+    try:
+        saved = locale.setlocale(locale.LC_NUMERIC)
+        try:
+            locale.setlocale(locale.LC_NUMERIC, "")
+            return locale.localeconv()["decimal_point"] or "."
+        finally:
+            locale.setlocale(locale.LC_NUMERIC, saved)
+    except locale.Error:
+        return "."
+
+
+def projection_rows(projection, decimal: str = ".", precision: int = 2,
+                    chunk: int = CHUNK_ROWS) -> Iterator[list]:
+    """Rândurile unei proiecții, formatate și generate pe bucăți (fără liste complete)"""
+    for start in range(0, len(projection), chunk):
+        for period, *values in projection.rows(range(start, min(start + chunk, len(projection)))):
+            formatted = [f"{v:.{precision}f}" for v in values]
+            if decimal != ".":
+                formatted = [v.replace(".", decimal) for v in formatted]
+            yield [period] + formatted
+
+
+def write_csv(path: str, rows: Iterable[list], total: int = None,
+              header: list = None, decimal: str = ".", compress: bool = None,
+              chunk_rows: int = CHUNK_ROWS, progress: Callable = None,
+              cancel_event=None) -> int:
+    """Scrie rândurile în fluxuri de câte chunk_rows; returnează numărul de rânduri scrise.
+
+    - compress=None alege gzip după extensia .gz
+    - cu separator zecimal "," delimitatorul devine ";" (convenția Excel RO)
+    - progress(fracțiune) e apelat după fiecare bucată, dacă total e cunoscut
+    - la cancel_event setat exportul se oprește după bucata curentă
+    """
+    if compress is None:
+        compress = path.lower().endswith(".gz")
+    delimiter = ";" if decimal == "," else ","
+
+    opener = gzip.open if compress else open
+    written = 0
+    with opener(path, "wt", newline="", encoding="utf-8") as f:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=delimiter)
+        if header:
+            writer.writerow(header)
+
+        for row in rows:
+            writer.writerow(row)
+            written += 1
+            if written % chunk_rows == 0:
+                f.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+                if progress and total:
+                    progress(written / total)
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+
+        f.write(buffer.getvalue())
+
+    if progress:
+        progress(1.0)
+    return written
+
+
+# ═══════════════════════════════════════════════════════════════
+# 📑 PDF - Raport paginat
+# ═══════════════════════════════════════════════════════════════
+
+@lru_cache(maxsize=1)
+def _pdf_styles() -> dict:
+    """Stilurile raportului, construite o singură dată per proces"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import TableStyle
+
+    sheet = getSampleStyleSheet()
+    return {
+        "title": sheet["Title"],
+        "heading": sheet["Heading2"],
+        "table": TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3B82F6')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#F8FAFC'), colors.white]),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#94A3B8'))
+        ]),
+        "summary": TableStyle([
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+            ('LINEBELOW', (0, 0), (-1, -1), 0.25, colors.HexColor('#CBD5E1'))
+        ]),
+    }
+
+
+def projection_summary(projection, value_format: Callable) -> list[tuple[str, str]]:
+    """Indicatorii principali ai proiecției, ca perechi (etichetă, valoare formatată)"""
+    final = projection.final_balance
+    invested = projection.total_invested
+    withdrawn = projection.total_withdrawn
+    final_real = float(projection.real[-1]) if len(projection) else projection.initial
+    return [
+        ("Sold final", value_format(final)),
+        ("Total investit", value_format(invested)),
+        ("Total retras", value_format(withdrawn)),
+        ("Profit", value_format(final - invested + withdrawn)),
+        ("Valoare reală finală", value_format(final_real)),
+        ("Inflație anuală", f"{projection.inflation * 100:.1f}%"),
+        ("Perioade", f"{len(projection)} ({projection.period_label(0)} - "
+                     f"{projection.period_label(len(projection) - 1)})" if len(projection) else "0"),
+    ]
+
+
+def _chart_drawing(projection, width: float, height: float):
+    """Graficul sold / investit / valoare reală ca desen vectorial reportlab"""
+    from reportlab.graphics.charts.legends import Legend
+    from reportlab.graphics.charts.lineplots import LinePlot
+    from reportlab.graphics.shapes import Drawing
+    from reportlab.lib import colors
+
+    step = max(1, math.ceil(len(projection) / PDF_CHART_POINTS))
+    indices = list(range(0, len(projection), step))
+    if indices[-1] != len(projection) - 1:
+        indices.append(len(projection) - 1)
+    series = [
+        ("Sold", projection.balance, colors.HexColor('#10B981')),
+        ("Investit", projection.invested, colors.HexColor('#3B82F6')),
+        ("Valoare reală", projection.real, colors.HexColor('#F59E0B')),
+    ]
+
+    drawing = Drawing(width, height)
+    plot = LinePlot()
+    plot.x, plot.y = 50, 30
+    plot.width, plot.height = width - 70, height - 60
+    plot.data = [[(i + 1, float(values[i])) for i in indices] for _, values, _ in series]
+    for line, (_, _, color) in zip(plot.lines, series):
+        line.strokeColor = color
+        line.strokeWidth = 1.5
+    plot.xValueAxis.valueMin = 1
+    plot.xValueAxis.valueMax = len(projection)
+    plot.yValueAxis.valueMin = 0
+    plot.xValueAxis.labels.fontSize = 7
+    plot.yValueAxis.labels.fontSize = 7
+    plot.yValueAxis.labelTextFormat = lambda v: f"{v:,.0f}".replace(",", " ")
+    drawing.add(plot)
+
+    legend = Legend()
+    legend.x, legend.y = 50, height - 8
+    legend.fontSize = 8
+    legend.alignment = "right"
+    legend.columnMaximum = 1
+    legend.colorNamePairs = [(color, name) for name, _, color in series]
+    drawing.add(legend)
+    return drawing
+
+
+def write_pdf(path: str, projection, value_format: Callable,
+              title: str = "ManuX Wealth OS - Proiecție Investiții",
+              progress: Callable = None, cancel_event=None) -> int:
+    """Raportul complet: sumar, grafic vectorial și toate perioadele, paginate.
+
+    Tabelul are antetul repetat pe fiecare pagină (repeatRows) și lățimi de
+    coloană fixe, astfel încât platypus nu remăsoară celulele la fiecare
+    împărțire. Returnează numărul de pagini.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table
+
+    styles = _pdf_styles()
+    doc = SimpleDocTemplate(path, pagesize=A4, title=title,
+                            leftMargin=1.5 * cm, rightMargin=1.5 * cm,
+                            topMargin=1.5 * cm, bottomMargin=1.5 * cm)
+
+    data = [PDF_HEADER]
+    for start in range(0, len(projection), CHUNK_ROWS):
+        for period, *values in projection.rows(range(start, min(start + CHUNK_ROWS, len(projection)))):
+            data.append([period] + [value_format(v) for v in values])
+        if cancel_event is not None and cancel_event.is_set():
+            raise ExportCancelled()
+    if progress:
+        progress(0.2)
+
+    elements = [Paragraph(title, styles["title"]), Spacer(1, 10)]
+    summary = Table(projection_summary(projection, value_format), colWidths=[6 * cm, 6 * cm], hAlign="LEFT")
+    summary.setStyle(styles["summary"])
+    elements += [summary, Spacer(1, 14)]
+    if len(projection):
+        elements += [_chart_drawing(projection, doc.width, 7 * cm), Spacer(1, 14)]
+    elements.append(Paragraph("Evoluție pe perioade", styles["heading"]))
+    table = Table(data, colWidths=[doc.width / len(PDF_HEADER)] * len(PDF_HEADER), repeatRows=1)
+    table.setStyle(styles["table"])
+    elements.append(table)
+
+    expected_pages = 1 + math.ceil(len(projection) / PDF_ROWS_PER_PAGE)
+
+    def on_page(canvas, document):
+        canvas.saveState()
+        canvas.setFont("Helvetica", 8)
+        canvas.drawRightString(A4[0] - 1.5 * cm, 1 * cm, f"Pagina {document.page}")
+        canvas.restoreState()
+        if cancel_event is not None and cancel_event.is_set():
+            raise ExportCancelled()
+        if progress:
+            progress(min(0.99, 0.2 + 0.8 * document.page / expected_pages))
+
+    doc.build(elements, onFirstPage=on_page, onLaterPages=on_page)
+    if progress:
+        progress(1.0)
+    return doc.page
@@ -0,0 +1,66 @@
+"""
+ManuX Wealth OS - Audit Importuri la Pornire
+Rulează `python -X importtime -c "import main_app"` într-un proces curat,
+afișează modulele cele mai lente și verifică faptul că modulele grele nu
+sunt importate pe calea critică de pornire.
+
+Utilizare: python import_audit.py [--top N] [--module main_app]
+Cod de ieșire 1 dacă un modul din DEFERRED apare la pornire.
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+# Module care trebuie încărcate doar la cerere (vezi lazy_imports.py).
+# tkinter.filedialog și PIL lipsesc intenționat: customtkinter le importă oricum.
+DEFERRED = (
+    "numpy", "reportlab",
+    "views", "views2", "views3", "simulation_engine",
+)
+
+
+def collect_import_times(module: str) -> list[tuple[str, int, int]]:
+    """[(modul, self_us, cumulat_us)] din ieșirea -X importtime, în ordinea importului"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import eșuat")
+    
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        entries.append((name, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Audit importuri la pornirea ManuX")
+    parser.add_argument("--module", default="main_app", help="modulul de pornire auditat")
+    parser.add_argument("--top", type=int, default=15, help="câte module lente se afișează")
+    args = parser.parse_args(argv)
+    
+    entries = collect_import_times(args.module)
+    total_us = sum(self_us for _, self_us, _ in entries)
+    
+    print(f"📦 {len(entries)} module importate de '{args.module}' în {total_us / 1000:.1f} ms\n")
+    print(f"{'Modul':<48}{'propriu':>10}{'cumulat':>10}")
+    for name, self_us, cumulative_us in sorted(entries, key=lambda e: e[2], reverse=True)[:args.top]:
+        print(f"{name:<48}{self_us / 1000:>8.1f}ms{cumulative_us / 1000:>8.1f}ms")
+    
+    imported = {name for name, _, _ in entries}
+    offenders = [name for name in DEFERRED if name in imported]
+    if offenders:
+        print(f"\n❌ Importate pe calea critică (ar trebui amânate): {', '.join(offenders)}")
+        return 1
+    print("\n✅ Niciun modul greu pe calea critică de pornire")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+ManuX Wealth OS - Importuri Amânate
+Module grele sau rar folosite (numpy, tkinter.filedialog, view-urile
+specializate) sunt încărcate abia la primul acces la un atribut, nu la
+pornirea aplicației. Auditul căii critice: python import_audit.py
+"""
+
+import importlib
+import importlib.util
+import sys
+
+
+class LazyModule:
+    """Proxy pentru un modul: importul real se face la primul acces la un atribut.
+
+    Dacă modulul lipsește, ImportError apare abia la utilizare, astfel încât
+    dependențele opționale nu blochează pornirea.
+    """
+
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            module = importlib.import_module(self.__dict__["_name"])
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "încărcat" if self.__dict__["_module"] is not None else "neîncărcat"
+        return f"<LazyModule {self.__dict__['_name']} ({state})>"
+
+
+def lazy_import(name: str):
+    """Modulul dacă e deja importat, altfel un LazyModule"""
+    return sys.modules.get(name) or LazyModule(name)
+
+
+def is_available(name: str) -> bool:
+    """True dacă modulul poate fi importat (fără a-l importa)"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
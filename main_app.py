@@ -3,32 +3,46 @@ ManuX Wealth OS - Aplicația Principală (VERSIUNE COMPLETĂ)
 Cu toate funcționalitățile: theme toggle, export CSV/PDF, retrageri, evoluție lunară etc.
 """
 
-import customtkinter as ctk
-import csv
+from profiling import profiler
+
+with profiler.phase("import:customtkinter"):
+    import customtkinter as ctk
 import os
+import time
 from datetime import datetime
 from typing import Callable
 
-from theme_styles import (
-    COLORS, COLORS_DARK, COLORS_LIGHT, FONTS, theme_manager, init_theme,
-    create_styled_button, format_currency, format_percentage
-)
-from widgets import (
-    CTkCard, CTkStatBox, CTkSliderWithLabel, CTkInputGroup,
-    NavigationButton, SidebarSection, DataTable, ToastNotification
-)
-from views import MonteCarloView, BasketView, FireView
-from views2 import RealEstateView, RebalanceView, TaxView
-from views3 import GuideView
+with profiler.phase("import:ui"):
+    from theme_styles import (
+        COLORS, COLORS_DARK, COLORS_LIGHT, FONTS, theme_manager, init_theme,
+        create_styled_button, format_currency, format_percentage
+    )
+    from widgets import (
+        CTkCard, CTkStatBox, CTkSliderWithLabel, CTkInputGroup,
+        NavigationButton, SidebarSection, DataTable, LineChart, ToastNotification,
+        Debouncer, BackgroundTask
+    )
+    from projection import ProjectionCache, MONTHS, COMPOUNDING
+from lazy_imports import lazy_import, is_available
+
+# Încărcate la prima utilizare, în afara căii critice de pornire
+views = lazy_import("views")
+views2 = lazy_import("views2")
+views3 = lazy_import("views3")
+filedialog = lazy_import("tkinter.filedialog")
+exporters = lazy_import("exporters")
+rate_service = lazy_import("rate_service")
 
 
 class ManuXWealthOS(ctk.CTk):
     """Aplicație principală ManuX Wealth OS - Versiune Completă"""
     
     def __init__(self):
-        super().__init__()
+        with profiler.phase("tk_root"):
+            super().__init__()
         
-        init_theme()
+        with profiler.phase("init_theme"):
+            init_theme()
         
         self.title("ManuX Wealth OS Enterprise 16.2")
         self.geometry("1450x950")
@@ -37,21 +51,55 @@ class ManuXWealthOS(ctk.CTk):
         # Variabile de stare
         self.currency_var = ctk.StringVar(value="EUR")
         self.is_dark = True
+        self.projection = None  # Ultima proiecție calculată (stocare pe coloane)
+        self._projection_cache = ProjectionCache(maxsize=64)
+        
+        # Export CSV în fundal, cu progres în toast
+        self._csv_task = BackgroundTask(
+            self, self._write_csv_export, on_done=self._on_export_done,
+            on_progress=lambda p: self.toast.update(f"Export CSV... {p:.0%}"),
+            on_error=lambda e: self.toast.show(f"Eroare export: {str(e)}", "error")
+        )
+        
+        self._pdf_task = BackgroundTask(
+            self, self._write_pdf_export, on_done=self._on_pdf_done,
+            on_progress=lambda p: self.toast.update(f"Export PDF... {p:.0%}"),
+            on_error=lambda e: self.toast.show(f"Eroare PDF: {str(e)}", "error")
+        )
+        
+        # Cursuri BCE: serviciul partajat cu Android, descărcare în fundal
+        self._rate_service = None
+        self._rates_notify = False
+        self._rates_task = BackgroundTask(
+            self, self._fetch_rates, on_done=self._on_rates_done, on_error=self._on_rates_error
+        )
+        
+        # Recalculare live: o schimbare izolată (tastare, click) se calculează după
+        # 100 ms de liniște; în timpul unui drag, cel puțin o dată la 150 ms (~7 cadre/s)
+        self._live_calc = Debouncer(self, lambda: self._on_calculate(live=True),
+                                    delay_ms=100, max_interval_ms=150)
         
         # Theme callback
         theme_manager.on_theme_change(self._apply_theme)
         
         # Setup UI
         self._setup_layout()
-        self._create_sidebar()
-        self._create_main_content()
+        with profiler.phase("sidebar"):
+            self._create_sidebar()
+        theme_manager.register_view(self.sidebar)
+        with profiler.phase("main_content"):
+            self._create_main_content()
         
         # Toast
         self.toast = ToastNotification(self)
         
         # Aplicare temă inițială
-        self._apply_theme("dark")
+        with profiler.phase("apply_theme"):
+            self._apply_theme("dark")
         self._show_view("dashboard")
+        
+        # Raport de pornire după prima desenare, apoi prewarm pentru restul view-urilor
+        self.after_idle(lambda: self.after(1, self._on_first_paint))
     
     def _setup_layout(self):
         self.columnconfigure(0, weight=0, minsize=340)
@@ -88,7 +136,8 @@ class ManuXWealthOS(ctk.CTk):
         # Logo custom (pune calea către logo-ul tău aici)
         # Exemplu: logo.png în același folder cu main_app.py
         try:
-            from PIL import Image
+            with profiler.phase("import:PIL"):
+                from PIL import Image
             logo_path = os.path.join(os.path.dirname(__file__), "logo.png")
             if os.path.exists(logo_path):
                 logo_img = ctk.CTkImage(light_image=Image.open(logo_path), 
@@ -159,9 +208,7 @@ class ManuXWealthOS(ctk.CTk):
         start_frame.columnconfigure((0,1), weight=1)
         
         self.start_month = ctk.CTkOptionMenu(
-            start_frame, values=["Ianuarie", "Februarie", "Martie", "Aprilie", "Mai", 
-                                "Iunie", "Iulie", "August", "Septembrie", "Octombrie", 
-                                "Noiembrie", "Decembrie"],
+            start_frame, values=MONTHS, command=self._on_param_change,
             fg_color=COLORS_DARK["card_bg"], button_color=COLORS["accent"]
         )
         self.start_month.grid(row=0, column=0, sticky="ew", padx=(0,5))
@@ -173,15 +220,17 @@ class ManuXWealthOS(ctk.CTk):
         self.years_slider = CTkSliderWithLabel(
             period_section.content, label="Durată (ani)",
             from_=1, to=50, initial_value=20, suffix=" ani",
-            progress_color=COLORS["accent"]
+            progress_color=COLORS["accent"],
+            command=self._on_param_change
         )
         self.years_slider.grid(row=1, column=0, sticky="ew", pady=5)
         
         self.compound_picker = ctk.CTkOptionMenu(
-            period_section.content, values=["Lunar", "Trimestrial", "Anual"],
+            period_section.content, values=list(COMPOUNDING), command=self._on_param_change,
             fg_color=COLORS_DARK["card_bg"], button_color=COLORS["accent"]
         )
         self.compound_picker.grid(row=2, column=0, sticky="ew", pady=5)
+        self.compound_picker.set("Lunar")
         
         # === CAPITAL & RANDAMENT ===
         capital_section = SidebarSection(self.sidebar, "Capital & Randament", "💰")
@@ -194,14 +243,16 @@ class ManuXWealthOS(ctk.CTk):
         self.interest_slider = CTkSliderWithLabel(
             capital_section.content, label="Dobândă Anuală",
             from_=0, to=20, initial_value=7, suffix="%", decimals=1,
-            progress_color=COLORS["success"]
+            progress_color=COLORS["success"],
+            command=self._on_param_change
         )
         self.interest_slider.grid(row=1, column=0, sticky="ew", pady=5)
         
         self.inflation_slider = CTkSliderWithLabel(
             capital_section.content, label="Inflație Anuală",
             from_=0, to=15, initial_value=3, suffix="%", decimals=1,
-            progress_color=COLORS["warning"]
+            progress_color=COLORS["warning"],
+            command=self._on_param_change
         )
         self.inflation_slider.grid(row=2, column=0, sticky="ew", pady=5)
         
@@ -221,14 +272,16 @@ class ManuXWealthOS(ctk.CTk):
         self.deposit_period_start = CTkSliderWithLabel(
             dca_section.content, label="De la anul",
             from_=1, to=50, initial_value=1, suffix="",
-            progress_color=COLORS["accent"]
+            progress_color=COLORS["accent"],
+            command=self._on_param_change
         )
         self.deposit_period_start.grid(row=3, column=0, sticky="ew", pady=2)
         
         self.deposit_period_end = CTkSliderWithLabel(
             dca_section.content, label="Până la anul",
             from_=1, to=50, initial_value=20, suffix="",
-            progress_color=COLORS["accent"]
+            progress_color=COLORS["accent"],
+            command=self._on_param_change
         )
         self.deposit_period_end.grid(row=4, column=0, sticky="ew", pady=2)
         
@@ -243,14 +296,16 @@ class ManuXWealthOS(ctk.CTk):
         self.withdraw_period_start = CTkSliderWithLabel(
             withdraw_section.content, label="De la anul",
             from_=1, to=50, initial_value=21, suffix="",
-            progress_color=COLORS["danger"]
+            progress_color=COLORS["danger"],
+            command=self._on_param_change
         )
         self.withdraw_period_start.grid(row=1, column=0, sticky="ew", pady=2)
         
         self.withdraw_period_end = CTkSliderWithLabel(
             withdraw_section.content, label="Până la anul",
             from_=1, to=50, initial_value=40, suffix="",
-            progress_color=COLORS["danger"]
+            progress_color=COLORS["danger"],
+            command=self._on_param_change
         )
         self.withdraw_period_end.grid(row=2, column=0, sticky="ew", pady=2)
         
@@ -273,6 +328,17 @@ class ManuXWealthOS(ctk.CTk):
                            command=self._export_csv).grid(row=0, column=0, sticky="ew", padx=(0,5))
         create_styled_button(export_frame, "📑 PDF", "secondary", width=100,
                            command=self._export_pdf).grid(row=0, column=1, sticky="ew")
+        
+        self.live_switch = ctk.CTkSwitch(
+            action_frame, text="⚡ Calcul live", font=FONTS["caption"],
+            command=self._on_live_toggle, progress_color=COLORS["success"]
+        )
+        self.live_switch.grid(row=3, column=0, sticky="w", pady=(10,0))
+        
+        # Câmpurile text declanșează recalcularea live la fiecare tastă
+        for group in (self.start_year, self.initial_input, self.monthly_input,
+                      self.deposit_growth, self.withdrawal_input):
+            group.entry.bind("<KeyRelease>", self._on_param_change)
     
     def _create_main_content(self):
         """Creează zona de conținut principal"""
@@ -282,31 +348,66 @@ class ManuXWealthOS(ctk.CTk):
         self.content_frame.rowconfigure(0, weight=1)
         
         self.views = {}
-        self._create_dashboard_view()
-        
-        # Module specializate
-        self.views["monte_carlo"] = MonteCarloView(
-            self.content_frame, lambda: self._show_view("dashboard"),
-            self._get_params, self.currency_var
-        )
-        self.views["basket"] = BasketView(
-            self.content_frame, lambda: self._show_view("dashboard")
-        )
-        self.views["fire"] = FireView(
-            self.content_frame, lambda: self._show_view("dashboard"), self.currency_var
-        )
-        self.views["real_estate"] = RealEstateView(
-            self.content_frame, lambda: self._show_view("dashboard"), self.currency_var
-        )
-        self.views["rebalance"] = RebalanceView(
-            self.content_frame, lambda: self._show_view("dashboard"), self.currency_var
-        )
-        self.views["tax"] = TaxView(
-            self.content_frame, lambda: self._show_view("dashboard")
-        )
-        self.views["guide"] = GuideView(
-            self.content_frame, lambda: self._show_view("dashboard")
+        with profiler.phase("view:dashboard"):
+            self._create_dashboard_view()
+        theme_manager.register_view(self.views["dashboard"])
+        
+        # Module specializate - construite la prima navigare (sau în timp mort)
+        back = lambda: self._show_view("dashboard")
+        self._view_factories = {
+            "monte_carlo": lambda: views.MonteCarloView(self.content_frame, back, self._get_params, self.currency_var),
+            "basket": lambda: views.BasketView(self.content_frame, back),
+            "fire": lambda: views.FireView(self.content_frame, back, self.currency_var),
+            "real_estate": lambda: views2.RealEstateView(self.content_frame, back, self.currency_var),
+            "rebalance": lambda: views2.RebalanceView(self.content_frame, back, self.currency_var),
+            "tax": lambda: views2.TaxView(self.content_frame, back),
+            "guide": lambda: views3.GuideView(self.content_frame, back),
+        }
+    
+    def _get_view(self, view_name: str):
+        """Returnează view-ul, construindu-l din registru la primul acces"""
+        view = self.views.get(view_name)
+        if view is None:
+            with profiler.phase(f"view:{view_name}"):
+                view = self.views[view_name] = self._view_factories[view_name]()
+            # Construit cu paleta dark; restilizat la afișare dacă tema curentă diferă
+            theme_manager.register_view(view)
+        return view
+    
+    def _prewarm_views(self):
+        """Construiește câte un view nefolosit per ciclu idle, fără a bloca interfața"""
+        pending = [name for name in self._view_factories if name not in self.views]
+        if pending:
+            self._get_view(pending[0])
+            self.after_idle(lambda: self.after(1, self._prewarm_views))
+    
+    def _on_first_paint(self):
+        profiler.record("first_paint", profiler.origin, time.perf_counter())
+        if profiler.enabled:
+            print(f"⏱️ Pornire ManuX: {profiler.report()}")
+            print(f"🎨 Registru temă: {self._record_theme_registry()}")
+            self._show_profile_overlay()
+        self._load_cached_rates()
+        self._prewarm_views()
+    
+    def _show_profile_overlay(self):
+        """Overlay mic cu timpii de pornire (click pentru a-l închide)"""
+        lines = [f"{name:<24}{duration * 1000:>8.1f} ms" for name, duration in profiler.timings.items()]
+        lines += [f"{name:<24}{value:>11}" for name, value in profiler.counters.items()]
+        overlay = ctk.CTkLabel(
+            self, text="⏱️ Profil pornire\n" + "\n".join(lines),
+            font=FONTS["mono_small"], justify="left", corner_radius=10,
+            fg_color=COLORS_DARK["panel_bg"], text_color=COLORS_DARK["text_secondary"]
         )
+        overlay.place(relx=1.0, rely=1.0, x=-20, y=-20, anchor="se")
+        overlay.bind("<Button-1>", lambda e: overlay.destroy())
+    
+    def _record_theme_registry(self) -> dict:
+        """Contoarele registrului ThemeManager în profil (scurgeri de widget-uri în sesiuni lungi)"""
+        stats = theme_manager.registry_stats()
+        for name, value in stats.items():
+            profiler.count(f"theme:{name}", value)
+        return stats
     
     def _get_params(self):
         """Returnează parametrii curenți pentru module"""
@@ -404,14 +505,14 @@ class ManuXWealthOS(ctk.CTk):
         )
         self.breakdown_table.grid(row=6, column=0, columnspan=4, sticky="nsew", pady=10)
         
-        # Proiecție grafică simplă (progress bars)
+        # Proiecție grafică (sold, investit, valoare reală)
         chart_card = CTkCard(view)
         chart_card.grid(row=7, column=0, columnspan=4, sticky="ew", pady=10)
         
         ctk.CTkLabel(chart_card, text="📈 Proiecție Vizuală", font=FONTS["subheader"]).pack(padx=20, pady=(15,10), anchor="w")
         
-        self.chart_frame = ctk.CTkFrame(chart_card, fg_color="transparent")
-        self.chart_frame.pack(padx=20, pady=(0,15), fill="x")
+        self.projection_chart = LineChart(chart_card)
+        self.projection_chart.pack(padx=20, pady=(0,15), fill="x")
     
     def _show_view(self, view_name: str):
         for v in self.views.values():
@@ -420,7 +521,9 @@ class ManuXWealthOS(ctk.CTk):
         if view_name == "calculator":
             view_name = "dashboard"
         
-        self.views[view_name].grid(row=0, column=0, sticky="nsew")
+        view = self._get_view(view_name)
+        theme_manager.apply_view(view)
+        view.grid(row=0, column=0, sticky="nsew")
     
     # === EVENT HANDLERS ===
     
@@ -432,14 +535,67 @@ class ManuXWealthOS(ctk.CTk):
     
     def _on_currency_change(self, value):
         self.toast.show(f"Valută: {value}", "info")
+        self._on_param_change()
+    
+    def _on_param_change(self, *_):
+        """Orice parametru modificat: în modul live programează o recalculare"""
+        if self.live_switch.get():
+            self._live_calc.trigger()
+    
+    def _on_live_toggle(self):
+        if self.live_switch.get():
+            self._on_calculate(live=True)
+        else:
+            self._live_calc.cancel()
+    
+    def _get_rate_service(self):
+        if self._rate_service is None:
+            self._rate_service = rate_service.RateService()
+        return self._rate_service
+    
+    def _load_cached_rates(self):
+        """Afișează ultimul snapshot salvat și îl reîmprospătează în fundal dacă e expirat"""
+        service = self._get_rate_service()
+        if service.snapshot.source != "fallback":
+            self._show_rates(service.snapshot)
+        if not service.is_fresh():
+            self._refresh_rates(notify=False)
+    
+    def _refresh_rates(self, notify: bool = True):
+        if self._rates_task.running:
+            return
+        self._rates_notify = notify
+        self._rates_task.start(self._get_rate_service())
     
-    def _refresh_rates(self):
-        # Simulare refresh (în realitate ar fi API call)
-        self.rate_label.configure(text="1 EUR = 4.98 RON | 1 USD = 4.62 RON ✓")
-        self.toast.show("Cursuri actualizate!", "success")
+    @staticmethod
+    def _fetch_rates(service, progress=None, cancel_event=None):
+        """Rulează pe thread-ul de lucru: cerere condiționată către BCE"""
+        return service.refresh()
     
-    def _on_calculate(self):
-        """Calculează proiecția completă"""
+    def _on_rates_done(self, snapshot):
+        self._show_rates(snapshot)
+        if self._rates_notify:
+            self.toast.show("Cursuri actualizate!", "success")
+    
+    def _on_rates_error(self, error):
+        snapshot = self._get_rate_service().snapshot
+        self._show_rates(snapshot)
+        if self._rates_notify:
+            when = f"din {snapshot.date}" if snapshot.date else "implicite"
+            self.toast.show(f"BCE indisponibil - cursuri {when}", "warning")
+    
+    def _show_rates(self, snapshot):
+        rates = snapshot.rates
+        ron, usd = rates.get("RON"), rates.get("USD")
+        if not ron or not usd:
+            return
+        text = f"1 EUR = {ron:.2f} RON | 1 USD = {ron / usd:.2f} RON"
+        if snapshot.date:
+            text += f" ({snapshot.date})"
+        self.rate_label.configure(text=text)
+    
+    def _on_calculate(self, live: bool = False):
+        """Calculează proiecția completă; live=True pentru recalcularea automată (fără notificări)"""
         try:
             initial = self.initial_input.get_float()
             monthly_deposit = self.monthly_input.get_float()
@@ -456,89 +612,24 @@ class ManuXWealthOS(ctk.CTk):
             
             currency = self.currency_var.get()
             is_monthly = self.view_mode.get() == "lunar"
+            compounding = COMPOUNDING[self.compound_picker.get()]
             
             # Start date
-            months = ["Ianuarie", "Februarie", "Martie", "Aprilie", "Mai", "Iunie",
-                     "Iulie", "August", "Septembrie", "Octombrie", "Noiembrie", "Decembrie"]
-            start_month_idx = months.index(self.start_month.get())
+            start_month_idx = MONTHS.index(self.start_month.get())
             start_year = int(self.start_year.get())
             
-            # Calcul
-            total = initial
-            total_invested = initial
-            total_withdrawn = 0
-            current_deposit = monthly_deposit
+            # Calcul (kernel vectorizat, memorat după parametri)
+            self.projection = self._projection_cache.project(
+                initial, monthly_deposit, monthly_withdrawal, years, rate, inflation,
+                deposit_growth, (deposit_start, deposit_end), (withdraw_start, withdraw_end),
+                monthly=is_monthly, start_year=start_year, start_month=start_month_idx,
+                compounding=compounding
+            )
+            proj = self.projection
             
-            self.breakdown_data = []
-            
-            if is_monthly:
-                # Calcul lunar
-                for month in range(1, years * 12 + 1):
-                    year = (month - 1) // 12 + 1
-                    month_in_year = (month - 1) % 12 + 1
-                    
-                    # Depozite
-                    deposit = current_deposit if deposit_start <= year <= deposit_end else 0
-                    total_invested += deposit
-                    
-                    # Retrageri
-                    withdrawal = monthly_withdrawal if withdraw_start <= year <= withdraw_end else 0
-                    total_withdrawn += withdrawal
-                    
-                    # Dobândă lunară
-                    monthly_rate = rate / 12
-                    interest = total * monthly_rate
-                    
-                    total = total + deposit - withdrawal + interest
-                    
-                    # Valoare reală
-                    months_elapsed = month
-                    monthly_inflation = (1 + inflation) ** (months_elapsed / 12)
-                    real_value = total / monthly_inflation
-                    
-                    # Data
-                    display_month = (start_month_idx + month - 1) % 12
-                    display_year = start_year + (start_month_idx + month - 1) // 12
-                    
-                    self.breakdown_data.append({
-                        "period": f"{months[display_month][:3]} {display_year}",
-                        "balance": total,
-                        "deposits": deposit,
-                        "withdrawals": withdrawal,
-                        "interest": interest,
-                        "real": real_value
-                    })
-                    
-                    # Creștere anuală depozit
-                    if month % 12 == 0:
-                        current_deposit *= (1 + deposit_growth)
-            else:
-                # Calcul anual
-                for year in range(1, years + 1):
-                    # Depozite anuale
-                    deposit = current_deposit * 12 if deposit_start <= year <= deposit_end else 0
-                    total_invested += deposit
-                    
-                    # Retrageri anuale
-                    withdrawal = monthly_withdrawal * 12 if withdraw_start <= year <= withdraw_end else 0
-                    total_withdrawn += withdrawal
-                    
-                    # Dobândă
-                    interest = (total + deposit/2 - withdrawal/2) * rate
-                    
-                    total = total + deposit - withdrawal + interest
-                    real_value = total / ((1 + inflation) ** year)
-                    
-                    self.breakdown_data.append({
-                        "period": str(start_year + year - 1),
-                        "balance": total,
-                        "deposits": deposit,
-                        "withdrawals": withdrawal,
-                        "interest": interest,
-                        "real": real_value
-                    })
-                    
-                    current_deposit *= (1 + deposit_growth)
+            total = proj.final_balance
+            total_invested = proj.total_invested
+            total_withdrawn = proj.total_withdrawn
             
             profit = total - total_invested + total_withdrawn
             final_real = total / ((1 + inflation) ** years)
@@ -560,66 +651,62 @@ class ManuXWealthOS(ctk.CTk):
             self.doubling_time_label.configure(text=f"Timp Dublare Prețuri: {doubling_time:.1f} ani")
             self.inflation_loss_label.configure(text=f"Pierdere din Inflație: {format_currency(inflation_loss, currency)}")
             
-            # Update table
-            self.breakdown_table.clear()
-            
-            # Limitează afișarea pentru lunar
-            data_to_show = self.breakdown_data if not is_monthly else self.breakdown_data[::3]  # Every 3 months
-            if is_monthly and len(data_to_show) > 100:
-                data_to_show = data_to_show[:100]
-            
-            for d in data_to_show:
-                self.breakdown_table.add_row([
-                    d["period"],
-                    format_currency(d["balance"], currency),
-                    format_currency(d["deposits"], currency) if d["deposits"] > 0 else "-",
-                    format_currency(d["withdrawals"], currency) if d["withdrawals"] > 0 else "-",
-                    format_currency(d["interest"], currency),
-                    format_currency(d["real"], currency)
-                ], [COLORS_DARK["text_primary"], COLORS["success"], COLORS["accent"], 
-                    COLORS["danger"], COLORS["purple"], COLORS["warning"]])
-            
-            # Update chart (progress bars simple)
-            for widget in self.chart_frame.winfo_children():
-                widget.destroy()
+            # Update table (virtualizat: se formatează doar rândurile vizibile)
+            row_colors = [COLORS_DARK["text_primary"], COLORS["success"], COLORS["accent"],
+                          COLORS["danger"], COLORS["purple"], COLORS["warning"]]
             
-            max_val = max(d["balance"] for d in self.breakdown_data) if self.breakdown_data else 1
+            def breakdown_row(index):
+                period, balance, deposits, withdrawals, interest, real = proj.row(index)
+                return [
+                    period,
+                    format_currency(balance, currency),
+                    format_currency(deposits, currency) if deposits > 0 else "-",
+                    format_currency(withdrawals, currency) if withdrawals > 0 else "-",
+                    format_currency(interest, currency),
+                    format_currency(real, currency)
+                ], row_colors
             
-            chart_data = self.breakdown_data[::max(1, len(self.breakdown_data)//8)][:8]
+            self.breakdown_table.set_source(len(proj), breakdown_row)
             
-            for i, d in enumerate(chart_data):
-                f = ctk.CTkFrame(self.chart_frame, fg_color="transparent")
-                f.pack(fill="x", pady=2)
-                
-                ctk.CTkLabel(f, text=d["period"], width=80, font=FONTS["caption"]).pack(side="left")
-                
-                bar = ctk.CTkProgressBar(f, progress_color=COLORS["success"])
-                bar.pack(side="left", fill="x", expand=True, padx=10)
-                bar.set(d["balance"] / max_val)
-                
-                ctk.CTkLabel(f, text=format_currency(d["balance"], currency), 
-                            width=120, font=FONTS["mono_small"]).pack(side="right")
+            # Update chart
+            self.projection_chart.set_series(
+                {
+                    "Sold": (proj.balance, COLORS["success"]),
+                    "Investit": (proj.invested, COLORS["accent"]),
+                    "Valoare reală": (proj.real, COLORS["warning"]),
+                },
+                start_label=proj.period_label(0) if len(proj) else "",
+                end_label=proj.period_label(len(proj) - 1) if len(proj) else "",
+                value_format=lambda v: format_currency(v, currency)
+            )
             
-            self.toast.show("Calcul finalizat!", "success")
+            if profiler.enabled:
+                # Tabelul și graficul se reconstruiesc la fiecare calcul: registrul nu trebuie să crească
+                self._record_theme_registry()
+            if not live:
+                self.toast.show("Calcul finalizat!", "success")
             
         except Exception as e:
-            self.toast.show(f"Eroare: {str(e)}", "error")
+            # În modul live valorile pot fi temporar invalide (tastare în curs)
+            if not live:
+                self.toast.show(f"Eroare: {str(e)}", "error")
     
     def _save_scenario(self):
         self.toast.show("Scenariul a fost salvat!", "success")
     
     def _export_csv(self):
-        """Exportă datele în CSV"""
-        if not hasattr(self, 'breakdown_data') or not self.breakdown_data:
+        """Exportă datele în CSV (în flux, pe un thread de lucru)"""
+        if not self.projection:
             self.toast.show("Calculează mai întâi!", "warning")
             return
-        
-        from tkinter import filedialog
+        if self._csv_task.running:
+            self.toast.show("Un export CSV este deja în curs", "warning")
+            return
         
         filename = f"manux_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         filepath = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            filetypes=[("CSV files", "*.csv"), ("CSV gzip", "*.csv.gz"), ("All files", "*.*")],
             initialfile=filename,
             title="Salvează Export CSV"
         )
@@ -627,37 +714,34 @@ class ManuXWealthOS(ctk.CTk):
         if not filepath:
             return  # Utilizatorul a anulat
         
-        try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(["Perioadă", "Sold", "Depozite", "Retrageri", "Dobândă", "Valoare Reală"])
-                
-                for d in self.breakdown_data:
-                    writer.writerow([
-                        d["period"], d["balance"], d["deposits"], 
-                        d["withdrawals"], d["interest"], d["real"]
-                    ])
-            
-            self.toast.show(f"Exportat: {os.path.basename(filepath)}", "success")
-        except Exception as e:
-            self.toast.show(f"Eroare export: {str(e)}", "error")
+        self.toast.show("Export CSV... 0%", "info", duration=0)
+        self._csv_task.start(filepath, self.projection, exporters.system_decimal_point())
+    
+    @staticmethod
+    def _write_csv_export(filepath, projection, decimal, progress=None, cancel_event=None):
+        """Rulează pe thread-ul de lucru: scrie proiecția bucată cu bucată"""
+        exporters.write_csv(
+            filepath, exporters.projection_rows(projection, decimal=decimal),
+            total=len(projection), header=exporters.CSV_HEADER, decimal=decimal,
+            progress=progress, cancel_event=cancel_event
+        )
+        return filepath
+    
+    def _on_export_done(self, filepath):
+        self.toast.show(f"Exportat: {os.path.basename(filepath)}", "success")
     
     def _export_pdf(self):
-        """Exportă datele în PDF"""
-        if not hasattr(self, 'breakdown_data') or not self.breakdown_data:
+        """Exportă raportul complet în PDF (pe un thread de lucru)"""
+        if not self.projection:
             self.toast.show("Calculează mai întâi!", "warning")
             return
         
-        try:
-            from reportlab.lib import colors
-            from reportlab.lib.pagesizes import A4
-            from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-            from reportlab.lib.styles import getSampleStyleSheet
-        except ImportError:
+        if not is_available("reportlab"):
             self.toast.show("Instalează reportlab: pip install reportlab", "warning")
             return
-        
-        from tkinter import filedialog
+        if self._pdf_task.running:
+            self.toast.show("Un export PDF este deja în curs", "warning")
+            return
         
         filename = f"manux_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
         filepath = filedialog.asksaveasfilename(
@@ -670,50 +754,26 @@ class ManuXWealthOS(ctk.CTk):
         if not filepath:
             return
         
-        try:
-            doc = SimpleDocTemplate(filepath, pagesize=A4)
-            elements = []
-            styles = getSampleStyleSheet()
-            
-            # Titlu
-            elements.append(Paragraph("ManuX Wealth OS - Proiecție Investiții", styles['Title']))
-            elements.append(Spacer(1, 20))
-            
-            # Tabel
-            data = [["Perioadă", "Sold", "Depozite", "Retrageri", "Dobândă", "Val. Reală"]]
-            currency = self.currency_var.get()
-            
-            for d in self.breakdown_data[:50]:  # Max 50 rânduri
-                data.append([
-                    d["period"],
-                    format_currency(d["balance"], currency),
-                    format_currency(d["deposits"], currency),
-                    format_currency(d["withdrawals"], currency),
-                    format_currency(d["interest"], currency),
-                    format_currency(d["real"], currency)
-                ])
-            
-            table = Table(data)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3B82F6')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F8FAFC')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#94A3B8'))
-            ]))
-            
-            elements.append(table)
-            doc.build(elements)
-            
-            self.toast.show(f"PDF exportat: {os.path.basename(filepath)}", "success")
-        except Exception as e:
-            self.toast.show(f"Eroare PDF: {str(e)}", "error")
+        currency = self.currency_var.get()
+        self.toast.show("Export PDF... 0%", "info", duration=0)
+        self._pdf_task.start(filepath, self.projection, lambda v: format_currency(v, currency))
+    
+    @staticmethod
+    def _write_pdf_export(filepath, projection, value_format, progress=None, cancel_event=None):
+        """Rulează pe thread-ul de lucru: construiește și scrie raportul"""
+        exporters.write_pdf(filepath, projection, value_format,
+                            progress=progress, cancel_event=cancel_event)
+        return filepath
+    
+    def _on_pdf_done(self, filepath):
+        self.toast.show(f"PDF exportat: {os.path.basename(filepath)}", "success")
 
 
 
 if __name__ == "__main__":
+    # Necesar pentru ProcessPoolExecutor (Monte Carlo) în executabilele PyInstaller
+    import multiprocessing
+    multiprocessing.freeze_support()
+    
     app = ManuXWealthOS()
     app.mainloop()
@@ -0,0 +1,117 @@
+"""
+ManuX Wealth OS - Profilare Pornire
+Timpi monotoni per fază și per view, pentru urmărirea regresiilor de pornire.
+
+Activare (opt-in):
+- variabila de mediu MANUX_PROFILE=1 (sau MANUX_PROFILE=cale/fisier.json)
+- argumentul --profile (sau --profile=cale/fisier.json)
+
+Fazele sunt înregistrate mereu (cost neglijabil); doar în modul profilare
+se afișează raportul, overlay-ul și se scrie JSON-ul la ieșire.
+"""
+
+import atexit
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+PROFILE_ENV = "MANUX_PROFILE"
+PROFILE_FLAG = "--profile"
+DEFAULT_OUTPUT = "manux_startup_profile.json"
+
+
+class StartupProfiler:
+    """Colectează durata fazelor de pornire, relativ la importul acestui modul"""
+
+    def __init__(self, enabled: bool = False, output: str = None):
+        self.origin = time.perf_counter()
+        self.enabled = False
+        self.output = None
+        self.phases = {}
+        self.counters = {}
+        if enabled:
+            self.enable(output)
+
+    def enable(self, output: str = None):
+        """Activează modul profilare; JSON-ul se scrie la ieșirea din aplicație"""
+        if not self.enabled:
+            atexit.register(self.dump)
+        self.enabled = True
+        self.output = output or DEFAULT_OUTPUT
+
+    @contextmanager
+    def phase(self, name: str):
+        """Măsoară blocul `with` ca fază cu numele dat"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def record(self, name: str, start: float, end: float):
+        """Înregistrează o fază cu momentele perf_counter() de început și sfârșit"""
+        self.phases[name] = (start - self.origin, end - start)
+
+    def count(self, name: str, value: int):
+        """Înregistrează un contor de depanare; rămâne ultima valoare raportată"""
+        self.counters[name] = value
+
+    def elapsed(self) -> float:
+        """Secunde de la pornirea profilării"""
+        return time.perf_counter() - self.origin
+
+    @property
+    def timings(self) -> dict:
+        """{fază: durată în secunde}, în ordinea înregistrării"""
+        return {name: duration for name, (_, duration) in self.phases.items()}
+
+    def report(self) -> str:
+        """Raport pe o linie: fază durată ms, ..."""
+        return ", ".join(f"{name} {duration * 1000:.0f} ms" for name, duration in self.timings.items())
+
+    def to_dict(self) -> dict:
+        # Importate aici: modulul e încărcat primul la pornire și trebuie să rămână ușor
+        import platform
+        from datetime import datetime
+
+        return {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "total_ms": round(self.elapsed() * 1000, 3),
+            "phases": {
+                name: {"start_ms": round(start * 1000, 3), "duration_ms": round(duration * 1000, 3)}
+                for name, (start, duration) in self.phases.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+    def dump(self, path: str = None):
+        """Scrie timpii ca JSON (implicit în fișierul configurat la activare)"""
+        import json
+
+        path = path or self.output or DEFAULT_OUTPUT
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return path
+
+
+def _profile_setting(argv: list, environ) -> tuple:
+    """(activ, fișier) din argumentele liniei de comandă sau din mediu"""
+    for arg in argv[1:]:
+        if arg == PROFILE_FLAG:
+            return True, None
+        if arg.startswith(PROFILE_FLAG + "="):
+            return True, arg.split("=", 1)[1] or None
+
+    value = environ.get(PROFILE_ENV, "").strip()
+    if value.lower() in ("", "0", "false", "no"):
+        return False, None
+    if value.lower() in ("1", "true", "yes"):
+        return True, None
+    return True, value
+
+
+profiler = StartupProfiler(*_profile_setting(sys.argv, os.environ))
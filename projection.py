@@ -0,0 +1,286 @@
+"""
+ManuX Wealth OS - Kernel de Proiecție (Calculator)
+Calculează evoluția soldului, depozitelor, retragerilor, dobânzii și valorii
+reale ca array-uri paralele, fără bucle Python pe perioade.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")  # încărcat la primul calcul, nu la pornire
+
+
+MONTHS = ["Ianuarie", "Februarie", "Martie", "Aprilie", "Mai", "Iunie",
+          "Iulie", "August", "Septembrie", "Octombrie", "Noiembrie", "Decembrie"]
+
+COLUMNS = ("balance", "deposits", "withdrawals", "interest", "real")
+
+# Frecvența de capitalizare (ori pe an) pentru opțiunile din sidebar
+COMPOUNDING = {"Zilnic": 365, "Lunar": 12, "Trimestrial": 4, "Anual": 1}
+
+
+@dataclass
+class Projection:
+    """Rezultatul unei proiecții, stocat pe coloane: câte un array float64 per mărime,
+    indexat după numărul perioadei (0 = prima lună / primul an).
+
+    Etichetele perioadelor ("Dec 2025", "2026") nu sunt stocate; se formatează
+    doar pentru rândurile efectiv afișate sau exportate.
+    """
+    periods_per_year: int
+    balance: np.ndarray
+    deposits: np.ndarray
+    withdrawals: np.ndarray
+    interest: np.ndarray
+    real: np.ndarray
+    initial: float
+    inflation: float
+    start_year: int = 0
+    start_month: int = 0
+
+    def __len__(self) -> int:
+        return self.balance.size
+
+    def period_label(self, index: int) -> str:
+        """Eticheta perioadei cu numărul index"""
+        if self.periods_per_year == 1:
+            return str(self.start_year + index)
+        offset = self.start_month + index
+        return f"{MONTHS[offset % 12][:3]} {self.start_year + offset // 12}"
+
+    def row(self, index: int) -> tuple:
+        """Un singur rând (etichetă, sold, depozite, retrageri, dobândă, valoare reală)"""
+        return (self.period_label(index), *(float(getattr(self, name)[index]) for name in COLUMNS))
+    
+    def rows(self, indices: Iterable[int] = None) -> Iterator[tuple]:
+        """Rânduri (etichetă, sold, depozite, retrageri, dobândă, valoare reală) pentru indicii ceruți"""
+        idx = np.arange(len(self)) if indices is None else np.asarray(list(indices), dtype=np.int64)
+        columns = zip(*(getattr(self, name)[idx].tolist() for name in COLUMNS))
+        for i, values in zip(idx.tolist(), columns):
+            yield (self.period_label(i), *values)
+
+    @property
+    def final_balance(self) -> float:
+        return float(self.balance[-1]) if self.balance.size else self.initial
+
+    @property
+    def invested(self) -> np.ndarray:
+        """Capitalul investit cumulat la sfârșitul fiecărei perioade"""
+        return self.initial + np.cumsum(self.deposits)
+    
+    @property
+    def total_invested(self) -> float:
+        return self.initial + float(self.deposits.sum())
+
+    @property
+    def total_withdrawn(self) -> float:
+        return float(self.withdrawals.sum())
+
+
+def _linear_recurrence(initial: float, growth: float, contributions: np.ndarray) -> np.ndarray:
+    """Soluția închisă a recurenței b[k] = b[k-1] * growth + c[k], pentru toate k deodată.
+
+    b[k] = growth^k * (b0 + Σ_{j<=k} c[j] * growth^-j). Contribuțiile sunt
+    constante pe segmente (ferestrele de depozit/retragere, creșterea anuală a
+    depozitului), iar suma cumulativă tratează toate segmentele într-o trecere.
+    """
+    k = np.arange(1, contributions.size + 1)
+    powers = growth ** k
+    return powers * (initial + np.cumsum(contributions / powers))
+
+
+def monthly_growth(rate: float, compounding: int) -> float:
+    """Factorul de creștere pe o lună pentru o dobândă nominală anuală capitalizată
+    de cel puțin 12 ori pe an: (1 + rate/compounding)^(compounding/12).
+
+    Capitalizarea zilnică (365 pași/an) nu necesită pași zilnici: exponentul
+    fracționar comprimă cele ~30 de capitalizări ale lunii într-un singur
+    factor, aplicat soldului de la începutul lunii. Frecvențele sub lunar
+    (trimestrial, anual) nu au un factor lunar - vezi _credit_at_boundaries.
+    """
+    if compounding < 12:
+        raise ValueError("Factorul lunar există doar pentru capitalizare cel puțin lunară")
+    return (1 + rate / compounding) ** (compounding / 12)
+
+
+def _credit_at_boundaries(initial: float, rate: float, compounding: int,
+                          flows: np.ndarray) -> tuple:
+    """(sold, dobândă) lunare pentru capitalizare sub lunară (trimestrial, anual).
+
+    În fiecare lună se acumulează dobândă simplă rate/12 pe soldul de la
+    începutul lunii, dar ea e creditată abia la data de capitalizare, la
+    sfârșitul celor L = 12/compounding luni; până atunci soldul afișat nu o
+    include. Un flux c_j din luna j a perioadei (intrat la sfârșitul lunii)
+    câștigă deci dobândă simplă pe cele L - j luni rămase, iar soldul la
+    capăt de perioadă satisface B = B_prev * (1 + rate/compounding) +
+    Σ c_j * (1 + rate/12 * (L - j)) - aceeași recurență liniară, pe perioade.
+    Fără fluxuri, soldul la datele de capitalizare e exact (1 + rate/m)^n.
+    """
+    if compounding <= 0 or 12 % compounding:
+        raise ValueError("Frecvența de capitalizare trebuie să dividă 12 sau să fie cel puțin lunară")
+    length = 12 // compounding
+    flows = flows.reshape(-1, length)
+
+    weights = 1 + rate / 12 * np.arange(length - 1, -1, -1)
+    period_end = _linear_recurrence(initial, 1 + rate / compounding, flows @ weights)
+    period_start = np.concatenate(([initial], period_end[:-1]))
+
+    balance = period_start[:, None] + np.cumsum(flows, axis=1)
+    interest = np.zeros_like(balance)
+    interest[:, -1] = period_end - balance[:, -1]
+    balance[:, -1] = period_end
+    return balance.ravel(), interest.ravel()
+
+
+def project(initial: float, monthly_deposit: float, monthly_withdrawal: float,
+            years: int, rate: float, inflation: float, deposit_growth: float,
+            deposit_window: tuple, withdraw_window: tuple,
+            monthly: bool = False, start_year: int = 0, start_month: int = 0,
+            compounding: int = 12) -> Projection:
+    """Proiecția completă pentru calculatorul principal.
+
+    Calculul se face mereu pe luni: depozitele și retragerile lunare intră la
+    sfârșitul lunii, iar depozitul crește anual cu deposit_growth. Pentru
+    capitalizare cel puțin lunară, dobânda lunii se aplică pe soldul de la
+    începutul ei cu factorul monthly_growth(rate, compounding); pentru
+    trimestrial / anual se acumulează lunar și se creditează doar la datele
+    de capitalizare (_credit_at_boundaries). Vederea anuală agregă lunile
+    (sold și valoare reală la sfârșitul anului, fluxuri și dobândă însumate),
+    deci ambele vederi dau exact același sold final.
+    Ferestrele sunt (an_start, an_final), inclusiv, cu anii numerotați de la 1.
+    start_year / start_month (0 = ianuarie) sunt folosite doar pentru etichete.
+    """
+    n = years * 12
+
+    period = np.arange(1, n + 1)
+    year = (period - 1) // 12 + 1
+
+    deposit_active = (deposit_window[0] <= year) & (year <= deposit_window[1])
+    withdraw_active = (withdraw_window[0] <= year) & (year <= withdraw_window[1])
+
+    # Depozitul crește o dată pe an, indiferent dacă fereastra e activă
+    deposit_level = monthly_deposit * (1 + deposit_growth) ** (year - 1.0)
+    deposits = np.where(deposit_active, deposit_level, 0.0)
+    withdrawals = np.where(withdraw_active, float(monthly_withdrawal), 0.0)
+
+    if compounding >= 12:
+        growth = monthly_growth(rate, compounding)
+        balance = _linear_recurrence(initial, growth, deposits - withdrawals)
+        previous = np.concatenate(([initial], balance[:-1]))
+        interest = previous * (growth - 1)
+    else:
+        balance, interest = _credit_at_boundaries(initial, rate, compounding, deposits - withdrawals)
+
+    # Factori de actualizare precalculați o singură dată per perioadă
+    inflation_factor = (1 + inflation) ** (period / 12)
+    real = balance / inflation_factor
+
+    result = Projection(
+        periods_per_year=12,
+        balance=balance,
+        deposits=deposits,
+        withdrawals=withdrawals,
+        interest=interest,
+        real=real,
+        initial=initial,
+        inflation=inflation,
+        start_year=start_year,
+        start_month=start_month,
+    )
+    return result if monthly else annual_view(result)
+
+
+def annual_view(monthly: Projection) -> Projection:
+    """Vederea anuală a unei proiecții lunare: sold și valoare reală la sfârșitul
+    fiecărui an, depozite, retrageri și dobândă însumate pe an"""
+    years = len(monthly) // 12
+    year_end = slice(11, None, 12)
+    deposits, withdrawals, interest = (
+        getattr(monthly, name)[:years * 12].reshape(years, 12).sum(axis=1)
+        for name in ("deposits", "withdrawals", "interest")
+    )
+    return Projection(
+        periods_per_year=1,
+        balance=monthly.balance[year_end],
+        deposits=deposits,
+        withdrawals=withdrawals,
+        interest=interest,
+        real=monthly.real[year_end],
+        initial=monthly.initial,
+        inflation=monthly.inflation,
+        start_year=monthly.start_year,
+        start_month=monthly.start_month,
+    )
+
+
+class ProjectionCache:
+    """Cache LRU pentru project(), cu cheia = tuplul normalizat al parametrilor.
+
+    Cheia nu include vederea (Anual/Lunar): se memorează proiecția lunară, iar
+    cea anuală e derivată din ea la prima cerere (annual_view) și păstrată în
+    aceeași intrare. Comutarea Anual/Lunar, a valutei sau revenirea la un
+    scenariu deja calculat nu mai rulează kernelul. Proiecțiile din cache au
+    array-urile read-only, pentru că aceeași instanță poate fi returnată de
+    mai multe ori.
+    """
+    
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+    
+    @staticmethod
+    def key(initial, monthly_deposit, monthly_withdrawal, years, rate, inflation,
+            deposit_growth, deposit_window, withdraw_window,
+            *, start_year=0, start_month=0, compounding=12) -> tuple:
+        """Tuplul normalizat: float-urile rotunjite elimină zgomotul slider-elor"""
+        def num(x):
+            return round(float(x), 10)
+        return (
+            num(initial), num(monthly_deposit), num(monthly_withdrawal), int(years),
+            num(rate), num(inflation), num(deposit_growth),
+            tuple(int(y) for y in deposit_window), tuple(int(y) for y in withdraw_window),
+            int(start_year), int(start_month), int(compounding),
+        )
+    
+    def project(self, *args, monthly: bool = False, **kwargs) -> Projection:
+        """Ca project(), dar returnează rezultatul memorat dacă există"""
+        key = self.key(*args, **kwargs)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self.misses += 1
+            entry = self._entries[key] = {True: self._freeze(project(*args, monthly=True, **kwargs))}
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        
+        monthly = bool(monthly)
+        if monthly not in entry:
+            entry[monthly] = self._freeze(annual_view(entry[True]))
+        return entry[monthly]
+    
+    @staticmethod
+    def _freeze(result: Projection) -> Projection:
+        for name in COLUMNS:
+            getattr(result, name).setflags(write=False)
+        return result
+    
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._entries), "maxsize": self.maxsize}
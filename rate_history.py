@@ -0,0 +1,230 @@
+"""
+ManuX Wealth OS - Istoric Cursuri BCE
+Partajat între aplicația desktop și Android (copiat în android/ la build).
+
+XML-ul istoric BCE (90 de zile sau complet, din 1999) este parsat o singură
+dată într-o matrice dată x valută (float64, față de EUR), salvată ca .npy și
+deschisă memory-mapped. Conversiile sunt vectorizate: coloane întregi de
+proiecție sau exporturi se convertesc la cursul zilei fiecărei valori
+(sau la cel curent) într-un singur apel, fără bucle Python.
+"""
+
+import json
+import os
+import time
+
+import numpy as np
+
+from rate_service import BASE_URL_ENV, DEFAULT_BASE_URL, DEFAULT_TIMEOUT, ECB_NAMESPACES, ssl_context
+
+
+HIST_90D_FILE = "eurofxref-hist-90d.xml"
+HIST_FULL_FILE = "eurofxref-hist.xml"
+
+DATES_FILE = "dates.npy"
+RATES_FILE = "rates.npy"
+META_FILE = "meta.json"
+
+
+def default_store_dir() -> str:
+    return os.path.join(os.path.expanduser("~"), ".manux", "ecb_history")
+
+
+def parse_ecb_history(source) -> tuple:
+    """(date, valute, matrice) din XML-ul istoric BCE (bytes sau fișier).
+
+    Parsare incrementală (iterparse): fișierul complet are ~6500 de zile.
+    Zilele sunt sortate crescător; lipsurile sunt NaN.
+    """
+    import io
+    import xml.etree.ElementTree as ET
+
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    cube_tag = "{%s}Cube" % ECB_NAMESPACES["eurofxref"]
+    days = {}
+    currencies = {}
+    current = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if elem.tag != cube_tag:
+            continue
+        if event == "start":
+            if elem.get("time"):
+                current = days.setdefault(elem.get("time"), {})
+            elif elem.get("currency") and current is not None:
+                code = elem.get("currency")
+                current[currencies.setdefault(code, len(currencies))] = float(elem.get("rate"))
+        elif elem.get("time"):
+            current = None
+            elem.clear()
+
+    if not days:
+        raise ValueError("Răspunsul BCE nu conține cursuri istorice")
+
+    dates = np.array(sorted(days), dtype="datetime64[D]")
+    rates = np.full((len(dates), len(currencies)), np.nan)
+    for row, day in enumerate(np.datetime_as_string(dates)):
+        values = days[str(day)]
+        rates[row, list(values)] = list(values.values())
+    return dates, list(currencies), rates
+
+
+class RateHistory:
+    """Matrice dată x valută cu cursurile BCE față de EUR, persistată memory-mapped"""
+
+    def __init__(self, store_dir: str = None, base_url: str = None,
+                 timeout: float = DEFAULT_TIMEOUT):
+        base_url = base_url or os.environ.get(BASE_URL_ENV) or DEFAULT_BASE_URL
+        if base_url.endswith(".xml"):       # același MANUX_RATES_URL ca RateService
+            base_url = base_url.rsplit("/", 1)[0]
+        self.base_url = base_url.rstrip("/") + "/"
+        self.store_dir = store_dir or default_store_dir()
+        self.timeout = timeout
+
+        self.dates = np.array([], dtype="datetime64[D]")
+        self.currencies = ["EUR"]
+        self.rates = np.ones((0, 1))
+        self.fetched_at = 0.0
+        self._index = {"EUR": 0}
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def first_date(self):
+        return self.dates[0] if len(self.dates) else None
+
+    @property
+    def last_date(self):
+        return self.dates[-1] if len(self.dates) else None
+
+    # ─── Persistență ───
+
+    def load(self) -> bool:
+        """Deschide matricea salvată (memory-mapped); False dacă nu există"""
+        try:
+            with open(os.path.join(self.store_dir, META_FILE), encoding="utf-8") as f:
+                meta = json.load(f)
+            dates = np.load(os.path.join(self.store_dir, DATES_FILE))
+            rates = np.load(os.path.join(self.store_dir, RATES_FILE), mmap_mode="r")
+        except (OSError, ValueError, KeyError):
+            return False
+        if rates.shape != (len(dates), len(meta["currencies"])):
+            return False
+        self._set(dates, meta["currencies"], rates)
+        self.fetched_at = meta.get("fetched_at", 0.0)
+        return True
+
+    def save(self):
+        """Scrie matricea (.npy) și metadatele; fișierele sunt înlocuite atomic"""
+        os.makedirs(self.store_dir, exist_ok=True)
+        for name, array in ((DATES_FILE, self.dates), (RATES_FILE, np.asarray(self.rates))):
+            tmp_path = os.path.join(self.store_dir, name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, os.path.join(self.store_dir, name))
+        tmp_path = os.path.join(self.store_dir, META_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"currencies": self.currencies, "fetched_at": self.fetched_at}, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.store_dir, META_FILE))
+        # Redeschis memory-mapped, ca după load()
+        self.load()
+
+    def _set(self, dates: np.ndarray, currencies: list, rates: np.ndarray):
+        self.dates = dates
+        self.currencies = list(currencies)
+        self.rates = rates
+        self._index = {code: i for i, code in enumerate(self.currencies)}
+
+    # ─── Actualizare ───
+
+    def update(self, full: bool = None) -> int:
+        """Descarcă istoricul BCE și îl îmbină cu cel salvat (blocant).
+
+        full=None alege fișierul complet doar dacă nu există încă un istoric
+        sau dacă cel salvat nu mai e acoperit de fereastra de 90 de zile; altfel ajunge
+        fișierul de 90 de zile. Returnează numărul de zile din istoric.
+        """
+        import urllib.request
+
+        if full is None:
+            full = not len(self) or (np.datetime64("today", "D") - self.last_date) > np.timedelta64(85, "D")
+        url = self.base_url + (HIST_FULL_FILE if full else HIST_90D_FILE)
+        request = urllib.request.Request(url, headers={"User-Agent": "ManuX-Wealth-OS"})
+        with urllib.request.urlopen(request, timeout=self.timeout, context=ssl_context()) as response:
+            dates, currencies, rates = parse_ecb_history(response)
+
+        self.merge(dates, currencies, rates)
+        self.fetched_at = time.time()
+        self.save()
+        return len(self)
+
+    def merge(self, dates: np.ndarray, currencies: list, rates: np.ndarray):
+        """Îmbină zile noi (cursuri față de EUR); la aceeași dată câștigă cele noi"""
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        rates = np.asarray(rates, dtype=float).reshape(len(dates), len(currencies))
+
+        all_currencies = self.currencies + [c for c in currencies if c not in self._index]
+        all_dates = np.union1d(self.dates, dates)
+        merged = np.full((len(all_dates), len(all_currencies)), np.nan)
+        if len(self.dates):
+            merged[np.searchsorted(all_dates, self.dates), :len(self.currencies)] = self.rates
+
+        columns = [all_currencies.index(c) for c in currencies]
+        rows = np.searchsorted(all_dates, dates)
+        incoming = merged[rows][:, columns]
+        known = ~np.isnan(rates)
+        incoming[known] = rates[known]
+        merged[np.ix_(rows, columns)] = incoming
+
+        merged[:, 0] = 1.0      # EUR
+        self._set(all_dates, all_currencies, merged)
+
+    def add_snapshot(self, day: str, rates: dict):
+        """Adaugă cursurile zilnice (de ex. RateService.snapshot) ca o zi din istoric"""
+        codes = [c for c in rates if c != "EUR"]
+        self.merge([day], codes, [[rates[c] for c in codes]])
+
+    # ─── Conversie ───
+
+    def _column(self, currency: str) -> int:
+        try:
+            return self._index[currency]
+        except KeyError:
+            raise ValueError(f"Valută necunoscută în istoricul BCE: {currency}") from None
+
+    def rows_for(self, dates) -> np.ndarray:
+        """Indicele zilei publicate cel mai recent la fiecare dată (weekend, sărbători)"""
+        if not len(self.dates):
+            raise ValueError("Istoricul de cursuri este gol - apelați update()")
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        rows = np.searchsorted(self.dates, dates, side="right") - 1
+        if np.any(rows < 0):
+            raise ValueError(f"Nu există cursuri BCE înainte de {self.first_date}")
+        return rows
+
+    def rate_series(self, dates, from_currency: str, to_currency: str) -> np.ndarray:
+        """Cursul from -> to la fiecare dată (None = ultima zi publicată)"""
+        src, dst = self._column(from_currency), self._column(to_currency)
+        if not len(self.dates):
+            raise ValueError("Istoricul de cursuri este gol - apelați update()")
+        rows = self.rows_for(dates) if dates is not None else len(self.dates) - 1
+        factor = np.asarray(self.rates[rows, dst] / self.rates[rows, src])
+        if np.any(np.isnan(factor)):
+            raise ValueError(f"BCE nu publica {from_currency}/{to_currency} la una dintre date")
+        return factor
+
+    def convert_series(self, amounts, dates, from_currency: str, to_currency: str) -> np.ndarray:
+        """Convertește un vector de sume, fiecare la cursul datei sale.
+
+        dates: vector de aceeași lungime (datetime64, "YYYY-MM-DD", date) sau
+        None pentru cursul curent. Valutele necunoscute și datele dinaintea
+        istoricului ridică ValueError - niciodată curs implicit 1.0.
+        """
+        amounts = np.asarray(amounts, dtype=float)
+        if from_currency == to_currency:
+            self._column(from_currency)
+            return amounts.copy()
+        return amounts * self.rate_series(dates, from_currency, to_currency)
@@ -0,0 +1,226 @@
+"""
+ManuX Wealth OS - Serviciu Cursuri Valutare (BCE)
+Partajat între aplicația desktop și Android (copiat în android/ la build).
+
+- cache în memorie cu TTL
+- ultimul snapshot valid salvat pe disc, cu momentul descărcării
+- cereri condiționate (If-None-Match / If-Modified-Since) -> 304 fără corp
+- refresh în fundal, cu cererile simultane comasate într-o singură descărcare
+- URL de bază configurabil (MANUX_RATES_URL), de ex. un server local de test
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from typing import Callable
+
+
+DEFAULT_BASE_URL = "https://www.ecb.europa.eu/stats/eurofxref/"
+DAILY_FILE = "eurofxref-daily.xml"
+BASE_URL_ENV = "MANUX_RATES_URL"
+DEFAULT_TTL = 6 * 3600          # BCE publică o dată pe zi lucrătoare (~16:00 CET)
+DEFAULT_TIMEOUT = 10
+
+ECB_NAMESPACES = {
+    "gesmes": "http://www.gesmes.org/xml/2002-08-01",
+    "eurofxref": "http://www.ecb.int/vocabulary/2002-08-01/eurofxref",
+}
+
+# Folosite doar dacă nu există nici rețea, nici snapshot salvat
+FALLBACK_RATES = {
+    "EUR": 1.0,
+    "USD": 1.05,
+    "RON": 4.98,
+    "GBP": 0.86,
+    "CHF": 0.94,
+    "CAD": 1.45,
+    "JPY": 158.0,
+}
+
+
+@lru_cache(maxsize=1)
+def ssl_context():
+    """Contextul TLS pentru cererile către BCE, construit o singură dată.
+
+    Python-for-android nu are un bundle CA de sistem, deci pe Android se
+    folosesc certificatele certifi; pe desktop certifi e opțional și, dacă
+    lipsește, rămân certificatele sistemului.
+    """
+    import ssl
+
+    try:
+        import certifi
+    except ImportError:
+        return ssl.create_default_context()
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def default_cache_path() -> str:
+    return os.path.join(os.path.expanduser("~"), ".manux", "ecb_rates.json")
+
+
+@dataclass
+class RateSnapshot:
+    """Cursurile față de EUR (EUR = 1.0) și metadatele descărcării"""
+    rates: dict
+    date: str = ""                  # data publicării BCE (YYYY-MM-DD)
+    fetched_at: float = 0.0         # time.time() la ultima validare cu serverul
+    etag: str = None
+    last_modified: str = None
+    source: str = field(default="fallback", compare=False)   # network / disk / fallback
+
+    def age(self, now: float = None) -> float:
+        """Secunde de la ultima validare"""
+        return (now if now is not None else time.time()) - self.fetched_at
+
+
+def parse_ecb_daily(content: bytes) -> tuple[str, dict]:
+    """(data, {valută: curs}) din XML-ul zilnic BCE"""
+    import xml.etree.ElementTree as ET
+
+    root = ET.fromstring(content)
+    day = root.find(".//eurofxref:Cube[@time]", ECB_NAMESPACES)
+    rates = {"EUR": 1.0}
+    for cube in root.findall(".//eurofxref:Cube[@currency]", ECB_NAMESPACES):
+        rates[cube.get("currency")] = float(cube.get("rate"))
+    if len(rates) == 1:
+        raise ValueError("Răspunsul BCE nu conține cursuri")
+    return (day.get("time") if day is not None else ""), rates
+
+
+class RateService:
+    """Cursuri BCE cu cache în memorie (TTL), persistență pe disc și refresh în fundal"""
+
+    def __init__(self, base_url: str = None, cache_path: str = None,
+                 ttl: float = DEFAULT_TTL, timeout: float = DEFAULT_TIMEOUT):
+        base_url = base_url or os.environ.get(BASE_URL_ENV) or DEFAULT_BASE_URL
+        self.url = base_url if base_url.endswith(".xml") else base_url.rstrip("/") + "/" + DAILY_FILE
+        self.cache_path = cache_path or default_cache_path()
+        self.ttl = ttl
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._inflight = None           # thread-ul refresh-ului în curs
+        self._waiters = []              # callback-uri pentru refresh-ul în curs
+
+    # ─── Citire ───
+
+    @property
+    def snapshot(self) -> RateSnapshot:
+        """Ultimul snapshot cunoscut (memorie, apoi disc, apoi cursurile implicite)"""
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = self._load() or RateSnapshot(dict(FALLBACK_RATES))
+            return self._snapshot
+
+    def is_fresh(self) -> bool:
+        snapshot = self.snapshot
+        return snapshot.source != "fallback" and snapshot.age() < self.ttl
+
+    def get_rates(self, force: bool = False) -> dict:
+        """Cursurile curente; contactează serverul doar dacă TTL-ul a expirat (blocant)"""
+        if force or not self.is_fresh():
+            try:
+                self.refresh()
+            except Exception:
+                pass  # rămâne ultimul snapshot bun (sau cursurile implicite)
+        return dict(self.snapshot.rates)
+
+    # ─── Descărcare ───
+
+    def refresh(self) -> RateSnapshot:
+        """Cerere condiționată către server; la 304 se reînnoiește doar momentul validării"""
+        import urllib.error
+        import urllib.request
+
+        current = self.snapshot
+        headers = {"User-Agent": "ManuX-Wealth-OS"}
+        if current.source != "fallback":
+            if current.etag:
+                headers["If-None-Match"] = current.etag
+            if current.last_modified:
+                headers["If-Modified-Since"] = current.last_modified
+
+        request = urllib.request.Request(self.url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout, context=ssl_context()) as response:
+                day, rates = parse_ecb_daily(response.read())
+                snapshot = RateSnapshot(
+                    rates=rates, date=day, fetched_at=time.time(),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    source="network",
+                )
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            snapshot = RateSnapshot(
+                rates=current.rates, date=current.date, fetched_at=time.time(),
+                etag=e.headers.get("ETag") or current.etag,
+                last_modified=e.headers.get("Last-Modified") or current.last_modified,
+                source="network",
+            )
+
+        with self._lock:
+            self._snapshot = snapshot
+        self._save(snapshot)
+        return snapshot
+
+    def refresh_async(self, callback: Callable = None) -> bool:
+        """Refresh pe un thread separat; returnează False dacă unul era deja în curs.
+
+        callback(snapshot, error) e apelat pe thread-ul de lucru: interfața trebuie
+        să-l mute pe thread-ul ei (Tk after / Kivy Clock.schedule_once).
+        """
+        with self._lock:
+            if callback:
+                self._waiters.append(callback)
+            if self._inflight is not None:
+                return False
+            self._inflight = threading.Thread(target=self._refresh_worker, daemon=True)
+            self._inflight.start()
+            return True
+
+    @property
+    def refreshing(self) -> bool:
+        return self._inflight is not None
+
+    def _refresh_worker(self):
+        snapshot, error = None, None
+        try:
+            snapshot = self.refresh()
+        except Exception as e:
+            error = e
+            snapshot = self.snapshot
+        with self._lock:
+            waiters, self._waiters = self._waiters, []
+            self._inflight = None
+        for callback in waiters:
+            callback(snapshot, error)
+
+    # ─── Persistență ───
+
+    def _load(self) -> RateSnapshot:
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+            data["source"] = "disk"
+            return RateSnapshot(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save(self, snapshot: RateSnapshot):
+        data = asdict(snapshot)
+        data.pop("source")
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass  # cache-ul pe disc e opțional; cursurile rămân în memorie
@@ -0,0 +1,606 @@
+"""
+ManuX Wealth OS - Motor de Simulare Monte Carlo (NumPy)
+Partajat între aplicația desktop (views.py) și cea Android (screens/monte_carlo.py).
+
+Matricea de randamente (scenarii x ani) este generată pe blocuri, fiecare
+dintr-o singură extragere, iar soldurile finale se obțin prin produse
+cumulative - fără bucle Python pe simulări. Blocurile pot rula în paralel
+(ProcessPoolExecutor) cu seed-uri independente și reproductibile.
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable
+
+import numpy as np
+
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# Scenariile sunt împărțite în blocuri de dimensiune fixă; fiecare bloc are
+# propriul flux aleator (SeedSequence.spawn), deci rezultatul depinde doar de
+# seed, nu și de numărul de procese. Modificarea constantei schimbă fluxurile.
+BLOCK_SIZE = 2000
+
+# Sub acest număr de scenarii costul pornirii proceselor depășește câștigul
+PARALLEL_THRESHOLD = 50_000
+
+# Peste acest număr de scenarii soldurile nu mai sunt păstrate în memorie:
+# percentilele vin dintr-un QuantileSketch cu eroare relativă garantată
+STREAMING_THRESHOLD = 1_000_000
+SKETCH_RELATIVE_ACCURACY = 0.005
+
+
+class SimulationCancelled(Exception):
+    """Ridicată când o simulare este anulată prin cancel_event"""
+
+
+@dataclass
+class MonteCarloResult:
+    """Statistici agregate pentru o rulare Monte Carlo"""
+    percentiles: dict[int, float]
+    mean: float
+    std: float
+    min: float
+    max: float
+    success_rate: float
+    total_invested: float
+    n_sims: int
+    seed: int = None
+    workers: int = 1
+    quantile_error: float = 0.0
+    balances: np.ndarray = field(default=None, repr=False)
+
+
+# ═══════════════════════════════════════════════════════════════
+# 📉 STREAMING - statistici cu memorie constantă
+# ═══════════════════════════════════════════════════════════════
+
+class RunningStats:
+    """Număr, medie, varianță, minim și maxim actualizate pe blocuri (fuziune Chan)"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def update(self, values: np.ndarray):
+        n = values.size
+        if n == 0:
+            return
+        block_mean = float(values.mean())
+        block_m2 = float(((values - block_mean) ** 2).sum())
+
+        total = self.count + n
+        delta = block_mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += block_m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    @property
+    def std(self) -> float:
+        """Deviația standard a populației (ca np.std)"""
+        return (self._m2 / self.count) ** 0.5 if self.count else 0.0
+
+
+class QuantileSketch:
+    """Sketch de cuantile cu eroare relativă garantată (tip DDSketch).
+
+    Valorile sunt numărate în bucket-uri logaritmice [γ^(i-1), γ^i) cu
+    γ = (1 + α) / (1 - α); orice cuantilă întoarsă diferă de valoarea exactă
+    (aceeași regulă de rang ca summarize) cu cel mult α relativ. Blocurile sunt
+    adăugate vectorial cu np.bincount. Memoria depinde doar de intervalul
+    valorilor (~1400 bucket-uri pentru 6 ordine de mărime la α = 0.5%) și este
+    plafonată la max_buckets prin comasarea bucket-urilor celor mai mici.
+    """
+
+    def __init__(self, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY, max_buckets: int = 4096):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self._gamma)
+        self._max_buckets = max_buckets
+        # Valorile pozitive și modulul celor negative au store-uri separate
+        self._stores = {1: [0, np.zeros(0, dtype=np.int64)], -1: [0, np.zeros(0, dtype=np.int64)]}
+        self._zeros = 0
+        self.count = 0
+
+    def _add_to_store(self, sign: int, magnitudes: np.ndarray):
+        if magnitudes.size == 0:
+            return
+        store = self._stores[sign]
+        keys = np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+        low = int(keys.min())
+        high = int(keys.max())
+
+        offset, counts = store
+        if counts.size == 0:
+            offset = low
+        new_low = min(offset, low)
+        new_high = max(offset + counts.size - 1, high)
+        if new_low != offset or new_high != offset + counts.size - 1:
+            grown = np.zeros(new_high - new_low + 1, dtype=np.int64)
+            grown[offset - new_low:offset - new_low + counts.size] = counts
+            offset, counts = new_low, grown
+
+        counts += np.bincount(keys - offset, minlength=counts.size)
+
+        if counts.size > self._max_buckets:
+            # Comasare în bucket-ul cel mai mic păstrat (afectează doar coada extremă)
+            excess = counts.size - self._max_buckets
+            counts[excess] += counts[:excess].sum()
+            counts = counts[excess:]
+            offset += excess
+
+        store[0], store[1] = offset, counts
+
+    def update(self, values: np.ndarray):
+        """Adaugă un bloc de valori"""
+        self._add_to_store(1, values[values > 0])
+        self._add_to_store(-1, -values[values < 0])
+        self._zeros += int(np.count_nonzero(values == 0))
+        self.count += values.size
+
+    def _value_at(self, key: int) -> float:
+        # Mijlocul (în sens relativ) al bucket-ului - eroare relativă <= α
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def quantile_at_rank(self, rank: int) -> float:
+        """Valoarea de pe poziția rank (0-based) din vectorul sortat, cu eroare relativă <= α"""
+        neg_offset, neg_counts = self._stores[-1]
+        n_neg = int(neg_counts.sum())
+        if rank < n_neg:
+            # Valorile negative: modul descrescător de la stânga la dreapta
+            cumulative = np.cumsum(neg_counts[::-1])
+            idx = int(np.searchsorted(cumulative, rank, side="right"))
+            return -self._value_at(neg_offset + neg_counts.size - 1 - idx)
+        rank -= n_neg
+        if rank < self._zeros:
+            return 0.0
+        rank -= self._zeros
+
+        pos_offset, pos_counts = self._stores[1]
+        cumulative = np.cumsum(pos_counts)
+        idx = min(int(np.searchsorted(cumulative, rank, side="right")), pos_counts.size - 1)
+        return self._value_at(pos_offset + idx)
+
+    def percentile(self, p: float) -> float:
+        """Percentila p cu aceeași regulă de rang ca summarize: int(n * p / 100)"""
+        return self.quantile_at_rank(min(int(self.count * p / 100), self.count - 1))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(counts.nbytes for _, counts in self._stores.values())
+
+
+# ═══════════════════════════════════════════════════════════════
+# 🎲 SIMULARE
+# ═══════════════════════════════════════════════════════════════
+
+def draw_returns(n_sims: int, years: int, rate: float, volatility: float,
+                 rng: np.random.Generator = None) -> np.ndarray:
+    """Extrage matricea de randamente anuale (n_sims x ani) dintr-o singură operație.
+
+    Fluxul aleator este consumat an cu an (ordine year-major), deci aceleași
+    valori se obțin și cu extrageri succesive de câte n_sims pe an - vezi
+    run_fan_chart, care avansează toate scenariile an cu an.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    return rng.normal(rate, volatility, size=(years, n_sims)).T
+
+
+def terminal_balances(returns: np.ndarray, initial: float, annual_contribution: float) -> np.ndarray:
+    """Soldul final al fiecărui scenariu pentru recurența
+    total = total * (1 + r) + contribuție (contribuția se adaugă la final de an).
+
+    Se folosesc produsele cumulative de la coadă (suffix products):
+    sold = initial * P[0] + contribuție * (P[1] + ... + P[n-1] + 1),
+    unde P[k] = (1 + r_k) * ... * (1 + r_n). Nu apar împărțiri, deci
+    randamentele <= -100% nu produc inf/NaN.
+    """
+    n_sims, years = returns.shape
+    if years == 0:
+        return np.full(n_sims, float(initial))
+
+    growth = 1.0 + returns
+    suffix = np.cumprod(growth[:, ::-1], axis=1)[:, ::-1]
+    return initial * suffix[:, 0] + annual_contribution * (suffix[:, 1:].sum(axis=1) + 1.0)
+
+
+def summarize(balances: np.ndarray, total_invested: float,
+              percentiles: tuple = PERCENTILES) -> MonteCarloResult:
+    """Calculează percentilele, media, deviația și rata de succes prin reduceri vectoriale.
+
+    Percentilele păstrează regula de indexare a versiunii inițiale
+    (valoarea de pe poziția int(n * p / 100) din vectorul sortat), dar folosesc
+    np.partition - O(n) în loc de o sortare completă.
+    """
+    n = balances.size
+    indices = [min(int(n * p / 100), n - 1) for p in percentiles]
+    partitioned = np.partition(balances, indices)
+
+    return MonteCarloResult(
+        percentiles={p: float(partitioned[i]) for p, i in zip(percentiles, indices)},
+        mean=float(balances.mean()),
+        std=float(balances.std()),
+        min=float(balances.min()),
+        max=float(balances.max()),
+        success_rate=float(np.count_nonzero(balances > total_invested)) / n * 100,
+        total_invested=total_invested,
+        n_sims=n,
+        balances=balances,
+    )
+
+
+def _simulate_block(seed: np.random.SeedSequence, n: int, years: int, rate: float,
+                    volatility: float, initial: float, annual_contribution: float) -> np.ndarray:
+    """Soldurile finale pentru un bloc de scenarii (rulează și în procesele copil)"""
+    returns = draw_returns(n, years, rate, volatility, np.random.default_rng(seed))
+    return terminal_balances(returns, initial, annual_contribution)
+
+
+def _block_plan(n_sims: int, seed: int = None) -> tuple:
+    """Împarte scenariile în blocuri și derivă câte un seed independent per bloc"""
+    seed_seq = np.random.SeedSequence(seed)
+    sizes = [min(BLOCK_SIZE, n_sims - start) for start in range(0, n_sims, BLOCK_SIZE)]
+    return seed_seq, seed_seq.spawn(len(sizes)), sizes
+
+
+def _auto_workers(n_sims: int) -> int:
+    if n_sims < PARALLEL_THRESHOLD:
+        return 1
+    return max(1, min(os.cpu_count() or 1, -(-n_sims // BLOCK_SIZE)))
+
+
+def _iter_blocks(block_seeds: list, sizes: list, params: tuple, workers: int,
+                 progress: Callable[[float], None], cancel_event: threading.Event):
+    """Generează soldurile finale bloc cu bloc, în ordinea indicilor.
+
+    În modul paralel rezultatele sosite în avans sunt ținute doar până le vine
+    rândul, deci memoria rămâne proporțională cu numărul de procese.
+    """
+    n_sims = sum(sizes)
+    done = 0
+
+    def cancelled():
+        return cancel_event is not None and cancel_event.is_set()
+
+    if workers == 1:
+        for block_seed, n in zip(block_seeds, sizes):
+            if cancelled():
+                raise SimulationCancelled()
+            yield _simulate_block(block_seed, n, *params)
+            done += n
+            if progress:
+                progress(done / n_sims)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_simulate_block, block_seed, n, *params): i
+            for i, (block_seed, n) in enumerate(zip(block_seeds, sizes))
+        }
+        pending = {}
+        next_index = 0
+        for future in as_completed(futures):
+            if cancelled():
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise SimulationCancelled()
+            pending[futures.pop(future)] = future.result()
+            while next_index in pending:
+                yield pending.pop(next_index)
+                done += sizes[next_index]
+                next_index += 1
+                if progress:
+                    progress(done / n_sims)
+
+
+def summarize_streaming(stats: RunningStats, sketch: QuantileSketch, above_invested: int,
+                        total_invested: float, percentiles: tuple = PERCENTILES) -> MonteCarloResult:
+    """Construiește rezultatul din statisticile incrementale (fără vectorul de solduri)"""
+    return MonteCarloResult(
+        percentiles={p: sketch.percentile(p) for p in percentiles},
+        mean=stats.mean,
+        std=stats.std,
+        min=stats.min,
+        max=stats.max,
+        success_rate=above_invested / stats.count * 100,
+        total_invested=total_invested,
+        n_sims=stats.count,
+        quantile_error=sketch.relative_accuracy,
+    )
+
+
+def run_monte_carlo(initial: float, monthly: float, years: int,
+                    rate: float, volatility: float, n_sims: int,
+                    seed: int = None,
+                    workers: int = None,
+                    streaming: bool = None,
+                    progress: Callable[[float], None] = None,
+                    cancel_event: threading.Event = None) -> MonteCarloResult:
+    """Rulează simularea completă și întoarce statisticile agregate.
+
+    seed=None alege entropie nouă; valoarea folosită e întoarsă în result.seed
+    și reproduce exact rularea. workers=None alege automat (1 proces sub
+    PARALLEL_THRESHOLD scenarii, altfel câte unul per nucleu). Blocurile sunt
+    reasamblate în ordine, deci rezultatul este identic indiferent de numărul
+    de procese. După fiecare bloc se apelează progress(fracțiune) și se
+    verifică cancel_event.
+
+    streaming=None activează automat modul streaming peste STREAMING_THRESHOLD
+    scenarii: blocurile trec printr-un QuantileSketch și RunningStats, memoria
+    rămâne constantă (câțiva KB + un bloc per proces), iar percentilele au
+    eroarea relativă result.quantile_error. Altfel percentilele sunt exacte.
+    """
+    seed_seq, block_seeds, sizes = _block_plan(n_sims, seed)
+    annual_contribution = monthly * 12
+    total_invested = initial + annual_contribution * years
+
+    workers = _auto_workers(n_sims) if workers is None else max(1, workers)
+    streaming = n_sims > STREAMING_THRESHOLD if streaming is None else streaming
+    params = (years, rate, volatility, initial, annual_contribution)
+
+    blocks = _iter_blocks(block_seeds, sizes, params, workers, progress, cancel_event)
+
+    if streaming:
+        stats = RunningStats()
+        sketch = QuantileSketch()
+        above_invested = 0
+        for balances in blocks:
+            stats.update(balances)
+            sketch.update(balances)
+            above_invested += int(np.count_nonzero(balances > total_invested))
+        result = summarize_streaming(stats, sketch, above_invested, total_invested)
+    else:
+        result = summarize(np.concatenate(list(blocks)), total_invested)
+
+    result.seed = seed_seq.entropy
+    result.workers = workers
+    return result
+
+
+# ═══════════════════════════════════════════════════════════════
+# 🌈 FAN CHART - benzi de percentile pe ani
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass
+class FanChartData:
+    """Benzi de percentile pe ani: bands[i, an] = percentila percentiles[i] la finalul anului.
+
+    Coloana 0 este momentul inițial (anul 0). Toate seriile sunt array-uri
+    float64 de lungime years + 1.
+    """
+    percentiles: tuple
+    bands: np.ndarray
+    mean: np.ndarray
+    seed: int = None
+    quantile_error: float = 0.0
+
+    @property
+    def years(self) -> int:
+        return self.bands.shape[1] - 1
+
+    def band(self, p: int) -> np.ndarray:
+        """Seria pentru o percentilă (ex. band(50) = mediana pe ani)"""
+        return self.bands[self.percentiles.index(p)]
+
+
+def run_fan_chart(initial: float, monthly: float, years: int,
+                  rate: float, volatility: float, n_sims: int,
+                  seed: int = None,
+                  percentiles: tuple = PERCENTILES,
+                  streaming: bool = None,
+                  progress: Callable[[float], None] = None,
+                  cancel_event: threading.Event = None) -> FanChartData:
+    """Calculează percentilele soldului pentru fiecare an, fără matricea completă de traiectorii.
+
+    Modul exact avansează toate scenariile an cu an într-un singur vector
+    (memorie O(n_sims)) și calculează percentilele anului cu np.partition.
+    Fiecare bloc își păstrează generatorul, iar extragerile an cu an coincid
+    cu cele din draw_returns, deci pentru același seed ultimul an coincide
+    (până la rotunjiri) cu run_monte_carlo. Modul streaming (automat peste STREAMING_THRESHOLD)
+    procesează bloc cu bloc și folosește câte un QuantileSketch per an.
+    """
+    seed_seq, block_seeds, sizes = _block_plan(n_sims, seed)
+    annual_contribution = monthly * 12
+    streaming = n_sims > STREAMING_THRESHOLD if streaming is None else streaming
+
+    bands = np.empty((len(percentiles), years + 1))
+    bands[:, 0] = initial
+    mean = np.empty(years + 1)
+    mean[0] = initial
+
+    def check_cancel():
+        if cancel_event is not None and cancel_event.is_set():
+            raise SimulationCancelled()
+
+    if streaming:
+        sketches = [QuantileSketch() for _ in range(years)]
+        sums = np.zeros(years)
+        done = 0
+        for block_seed, n in zip(block_seeds, sizes):
+            check_cancel()
+            returns = draw_returns(n, years, rate, volatility, np.random.default_rng(block_seed))
+            balances = np.full(n, float(initial))
+            for year in range(years):
+                balances = balances * (1.0 + returns[:, year]) + annual_contribution
+                sketches[year].update(balances)
+                sums[year] += balances.sum()
+            done += n
+            if progress:
+                progress(done / n_sims)
+
+        for year, sketch in enumerate(sketches, start=1):
+            bands[:, year] = [sketch.percentile(p) for p in percentiles]
+        mean[1:] = sums / n_sims
+        quantile_error = SKETCH_RELATIVE_ACCURACY
+    else:
+        generators = [np.random.default_rng(block_seed) for block_seed in block_seeds]
+        indices = [min(int(n_sims * p / 100), n_sims - 1) for p in percentiles]
+        balances = np.full(n_sims, float(initial))
+        for year in range(1, years + 1):
+            check_cancel()
+            returns = np.concatenate([g.normal(rate, volatility, n) for g, n in zip(generators, sizes)])
+            balances = balances * (1.0 + returns) + annual_contribution
+            bands[:, year] = np.partition(balances, indices)[indices]
+            mean[year] = balances.mean()
+            if progress:
+                progress(year / years)
+        quantile_error = 0.0
+
+    return FanChartData(
+        percentiles=tuple(percentiles),
+        bands=bands,
+        mean=mean,
+        seed=seed_seq.entropy,
+        quantile_error=quantile_error,
+    )
+
+
+# ═══════════════════════════════════════════════════════════════
+# 🔥 FIRE - secvența randamentelor în faza de retragere
+# ═══════════════════════════════════════════════════════════════
+
+FIRE_MAX_YEARS = 50
+FIRE_HORIZON = 30
+FIRE_SIMULATIONS = 5000
+
+
+@dataclass
+class FireResult:
+    """Rezultatul unei simulări FIRE stocastice.
+
+    ruin_by_year[t] = probabilitatea (%) ca portofoliul să fie epuizat până la
+    finalul anului t (t = 0..years). safe_withdrawal_rates[s] = rata inițială
+    de retragere (% din portofoliu, indexată apoi cu inflația) care rezistă
+    orizontului în s% dintre scenarii.
+    """
+    ruin_by_year: np.ndarray
+    success_rate: float
+    median_depletion_year: float
+    safe_withdrawal_rates: dict[int, float]
+    median_balance: np.ndarray
+    horizon: int
+    n_sims: int
+
+
+class FireSimulation:
+    """Scenarii FIRE pe o matrice de randamente standard extrasă o singură dată.
+
+    Randamentele sunt rate + volatilitate * Z, deci schimbarea randamentului,
+    volatilității sau inflației (ex. la tragerea slider-ului) nu reextrage
+    nimic și fiecare evaluare durează câteva milisecunde.
+    """
+
+    def __init__(self, n_sims: int = FIRE_SIMULATIONS, years: int = FIRE_MAX_YEARS, seed: int = None):
+        self.seed_seq = np.random.SeedSequence(seed)
+        self.n_sims = n_sims
+        self.years = years
+        # Year-major, ca în draw_returns
+        self._z = np.random.default_rng(self.seed_seq).standard_normal((years, n_sims)).T
+
+    def returns(self, rate: float, volatility: float) -> np.ndarray:
+        return rate + volatility * self._z
+
+    def run(self, portfolio: float, annual_withdrawal: float, rate: float,
+            volatility: float, inflation: float, horizon: int = FIRE_HORIZON,
+            success_levels: tuple = (90, 95)) -> FireResult:
+        """Simulează retragerile indexate cu inflația pe toate scenariile.
+
+        Ca în simularea deterministă, retragerea se face la finalul anului,
+        după aplicarea randamentului, iar portofoliul e epuizat când soldul
+        ajunge <= 0. Soldul este liniar în retragerea W:
+        sold_t = P * G_t - W * S_t, deci fiecare scenariu are o retragere maximă
+        sustenabilă P * min(G_t / S_t) pe orizont, din care rata sigură pentru
+        un nivel de succes rezultă direct ca o cuantilă.
+        """
+        n, years = self.n_sims, self.years
+        horizon = min(horizon, years)
+        growth = 1.0 + self.returns(rate, volatility)
+        indexation = (1.0 + inflation) ** np.arange(years)
+
+        balances = np.full(n, float(portfolio))
+        depletion_year = np.full(n, np.inf)
+        median_balance = np.empty(years + 1)
+        median_balance[0] = portfolio
+
+        g = np.ones(n)
+        s = np.zeros(n)
+        sustainable = np.full(n, np.inf)
+
+        for t in range(years):
+            balances = balances * growth[:, t] - annual_withdrawal * indexation[t]
+            newly_depleted = (balances <= 0) & np.isinf(depletion_year)
+            depletion_year[newly_depleted] = t + 1
+            balances = np.maximum(balances, 0.0)
+            median_balance[t + 1] = np.median(balances)
+
+            if t < horizon:
+                g = g * growth[:, t]
+                s = s * growth[:, t] + indexation[t]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    ratio = np.where(s > 0, np.maximum(g, 0.0) / s, np.where(g > 0, np.inf, 0.0))
+                sustainable = np.minimum(sustainable, ratio)
+
+        finite = depletion_year[np.isfinite(depletion_year)].astype(np.int64)
+        ruin_by_year = np.cumsum(np.bincount(finite, minlength=years + 1)) / n * 100
+        median_depletion = float(np.median(depletion_year))
+
+        return FireResult(
+            ruin_by_year=ruin_by_year,
+            success_rate=100 - float(ruin_by_year[horizon]),
+            median_depletion_year=median_depletion if np.isfinite(median_depletion) else None,
+            safe_withdrawal_rates={
+                level: float(np.quantile(sustainable, 1 - level / 100)) * 100
+                for level in success_levels
+            },
+            median_balance=median_balance,
+            horizon=horizon,
+            n_sims=n,
+        )
+
+    def _survival_rate(self, growth: np.ndarray, indexation: np.ndarray,
+                       portfolio: float, annual_withdrawal: float, horizon: int) -> float:
+        """Procentul scenariilor care nu se epuizează pe orizont (fără statisticile complete)"""
+        balances = np.full(self.n_sims, float(portfolio))
+        alive = np.ones(self.n_sims, dtype=bool)
+        for t in range(horizon):
+            balances = balances * growth[:, t] - annual_withdrawal * indexation[t]
+            alive &= balances > 0
+        return float(np.count_nonzero(alive)) / self.n_sims * 100
+
+    def solve_withdrawal(self, portfolio: float, rate: float, volatility: float,
+                         inflation: float, target_success: float = 95,
+                         horizon: int = FIRE_HORIZON, tolerance: float = 1.0,
+                         max_iterations: int = 60) -> float:
+        """Retragerea anuală maximă (indexată cu inflația) care rezistă orizontului
+        în cel puțin target_success% dintre scenarii.
+
+        Căutare prin bisecție pe aceeași matrice pre-extrasă: rata de succes
+        este o funcție în trepte, descrescătoare în retragere, deci bisecția
+        converge sigur. Cu volatility=0 toate scenariile sunt identice și
+        rezultatul este retragerea maximă deterministă pentru orizont.
+        Precizia implicită este de 1 unitate monetară pe an.
+        """
+        horizon = min(horizon, self.years)
+        growth = 1.0 + self.returns(rate, volatility)
+        indexation = (1.0 + inflation) ** np.arange(self.years)
+
+        low, high = 0.0, float(portfolio) * max(1.0, float(growth[:, 0].max()))
+        if self._survival_rate(growth, indexation, portfolio, low, horizon) < target_success:
+            return 0.0
+
+        for _ in range(max_iterations):
+            if high - low <= tolerance:
+                break
+            mid = (low + high) / 2
+            if self._survival_rate(growth, indexation, portfolio, mid, horizon) >= target_success:
+                low = mid
+            else:
+                high = mid
+        return low
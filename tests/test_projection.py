@@ -0,0 +1,186 @@
+"""
+Paritate între kernelul vectorizat projection.project() și bucla lună cu lună
+din vechiul ManuXWealthOS._on_calculate (păstrată aici ca referință).
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from projection import COMPOUNDING, MONTHS, ProjectionCache, project  # noqa: E402
+
+
+def reference_loop(initial, monthly_deposit, monthly_withdrawal, years, rate, inflation,
+                   deposit_growth, deposit_window, withdraw_window,
+                   start_year=2025, start_month=0, compounding=12):
+    """Bucla lunară originală din _on_calculate, extinsă cu frecvența de capitalizare.
+
+    Lunar: dobânda total * rate / 12, exact ca în codul vechi. Zilnic: factorul
+    lunar echivalent. Trimestrial / anual: dobânda simplă se acumulează lunar și
+    se creditează la sfârșitul perioadei de capitalizare.
+    """
+    deposit_start, deposit_end = deposit_window
+    withdraw_start, withdraw_end = withdraw_window
+
+    total = initial
+    current_deposit = monthly_deposit
+    accrued = 0.0
+    months_per_credit = 12 // compounding if compounding < 12 else 1
+    rows = []
+
+    for month in range(1, years * 12 + 1):
+        year = (month - 1) // 12 + 1
+
+        # Depozite
+        deposit = current_deposit if deposit_start <= year <= deposit_end else 0
+
+        # Retrageri
+        withdrawal = monthly_withdrawal if withdraw_start <= year <= withdraw_end else 0
+
+        # Dobândă
+        if compounding == 12:
+            interest = total * (rate / 12)
+        elif compounding > 12:
+            interest = total * ((1 + rate / compounding) ** (compounding / 12) - 1)
+        else:
+            accrued += total * rate / 12
+            interest = 0.0
+            if month % months_per_credit == 0:
+                interest, accrued = accrued, 0.0
+
+        total = total + deposit - withdrawal + interest
+
+        # Valoare reală
+        months_elapsed = month
+        monthly_inflation = (1 + inflation) ** (months_elapsed / 12)
+        real_value = total / monthly_inflation
+
+        # Data
+        display_month = (start_month + month - 1) % 12
+        display_year = start_year + (start_month + month - 1) // 12
+
+        rows.append({
+            "period": f"{MONTHS[display_month][:3]} {display_year}",
+            "balance": total,
+            "deposits": deposit,
+            "withdrawals": withdrawal,
+            "interest": interest,
+            "real": real_value
+        })
+
+        # Creștere anuală depozit
+        if month % 12 == 0:
+            current_deposit *= (1 + deposit_growth)
+
+    return rows
+
+
+def annual_rows(monthly_rows, start_year=2025):
+    """Agregarea anuală: sold și valoare reală la sfârșitul anului, fluxuri însumate"""
+    rows = []
+    for y in range(len(monthly_rows) // 12):
+        months = monthly_rows[12 * y:12 * (y + 1)]
+        rows.append({
+            "period": str(start_year + y),
+            "balance": months[-1]["balance"],
+            "deposits": sum(m["deposits"] for m in months),
+            "withdrawals": sum(m["withdrawals"] for m in months),
+            "interest": sum(m["interest"] for m in months),
+            "real": months[-1]["real"],
+        })
+    return rows
+
+
+SCENARIOS = {
+    # Depozite care pornesc și se opresc în mijlocul orizontului, retrageri suprapuse
+    "ferestre_mijloc": dict(initial=10_000, monthly_deposit=500, monthly_withdrawal=300, years=15,
+                            rate=0.07, inflation=0.03, deposit_growth=0.02,
+                            deposit_window=(3, 9), withdraw_window=(7, 12)),
+    # Retragerile depășesc soldul - soldul devine negativ
+    "sold_negativ": dict(initial=2_000, monthly_deposit=100, monthly_withdrawal=900, years=10,
+                         rate=0.05, inflation=0.04, deposit_growth=0.0,
+                         deposit_window=(1, 2), withdraw_window=(4, 10)),
+    # Ferestre care depășesc orizontul, dobândă zero
+    "fara_dobanda": dict(initial=0, monthly_deposit=250, monthly_withdrawal=50, years=8,
+                         rate=0.0, inflation=0.02, deposit_growth=0.05,
+                         deposit_window=(2, 30), withdraw_window=(6, 30)),
+    # Orizont lung, rată mare
+    "orizont_lung": dict(initial=50_000, monthly_deposit=1_000, monthly_withdrawal=4_000, years=50,
+                         rate=0.12, inflation=0.035, deposit_growth=0.03,
+                         deposit_window=(1, 25), withdraw_window=(26, 50)),
+}
+
+
+def assert_parity(projection, rows):
+    assert len(projection) == len(rows)
+    scale = max(1.0, max(abs(r["balance"]) for r in rows))
+    for column in ("balance", "deposits", "withdrawals", "interest", "real"):
+        expected = np.array([r[column] for r in rows])
+        np.testing.assert_allclose(getattr(projection, column), expected,
+                                   rtol=1e-9, atol=1e-9 * scale, err_msg=column)
+    assert [r[0] for r in projection.rows()] == [r["period"] for r in rows]
+
+
+@pytest.mark.parametrize("compounding", sorted(COMPOUNDING.values()))
+@pytest.mark.parametrize("scenario", sorted(SCENARIOS))
+def test_monthly_view_matches_reference_loop(scenario, compounding):
+    params = SCENARIOS[scenario]
+    projection = project(**params, monthly=True, start_year=2025, start_month=4,
+                         compounding=compounding)
+    assert_parity(projection, reference_loop(**params, start_month=4, compounding=compounding))
+
+
+@pytest.mark.parametrize("compounding", sorted(COMPOUNDING.values()))
+@pytest.mark.parametrize("scenario", sorted(SCENARIOS))
+def test_annual_view_matches_aggregated_reference(scenario, compounding):
+    params = SCENARIOS[scenario]
+    projection = project(**params, monthly=False, start_year=2025, compounding=compounding)
+    assert_parity(projection, annual_rows(reference_loop(**params, compounding=compounding)))
+
+
+@pytest.mark.parametrize("compounding", sorted(COMPOUNDING.values()))
+def test_annual_and_monthly_views_agree_on_final_balance(compounding):
+    params = SCENARIOS["ferestre_mijloc"]
+    annual = project(**params, monthly=False, compounding=compounding)
+    monthly = project(**params, monthly=True, compounding=compounding)
+    assert annual.final_balance == pytest.approx(monthly.final_balance, rel=1e-12)
+    assert annual.total_invested == pytest.approx(monthly.total_invested, rel=1e-12)
+
+
+@pytest.mark.parametrize("compounding", [1, 4])
+def test_sub_monthly_interest_is_credited_only_at_compounding_dates(compounding):
+    params = SCENARIOS["ferestre_mijloc"]
+    projection = project(**params, monthly=True, compounding=compounding)
+    credited = np.flatnonzero(projection.interest)
+    assert np.all((credited + 1) % (12 // compounding) == 0)
+
+
+@pytest.mark.parametrize("compounding", sorted(COMPOUNDING.values()))
+def test_without_cash_flows_balance_is_exact_compound_interest(compounding):
+    projection = project(1_000, 0, 0, 10, 0.06, 0.0, 0.0, (1, 0), (1, 0),
+                         monthly=False, compounding=compounding)
+    years = np.arange(1, 11)
+    np.testing.assert_allclose(projection.balance,
+                               1_000 * (1 + 0.06 / compounding) ** (compounding * years),
+                               rtol=1e-12)
+
+
+def test_cache_switching_view_reuses_the_monthly_kernel_run():
+    params = SCENARIOS["ferestre_mijloc"]
+    cache = ProjectionCache()
+    monthly = cache.project(*params.values(), monthly=True, start_year=2025, compounding=4)
+    annual = cache.project(*params.values(), monthly=False, start_year=2025, compounding=4)
+
+    assert cache.info()["misses"] == 1 and cache.info()["hits"] == 1
+    assert cache.project(*params.values(), monthly=False, start_year=2025, compounding=4) is annual
+    assert cache.project(*params.values(), monthly=True, start_year=2025, compounding=4) is monthly
+
+    expected = project(**params, monthly=False, start_year=2025, compounding=4)
+    assert annual.periods_per_year == 1
+    for column in ("balance", "deposits", "withdrawals", "interest", "real"):
+        np.testing.assert_array_equal(getattr(annual, column), getattr(expected, column))
+        assert not getattr(annual, column).flags.writeable
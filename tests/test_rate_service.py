@@ -0,0 +1,71 @@
+"""
+Cererile către BCE (RateService.refresh, RateHistory.update) folosesc
+contextul TLS comun ssl_context() - necesar pe Android, unde nu există
+un bundle CA de sistem.
+"""
+
+import io
+import os
+import sys
+import urllib.request
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rate_service  # noqa: E402
+from rate_service import RateService, ssl_context  # noqa: E402
+
+
+ECB_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<gesmes:Envelope xmlns:gesmes="http://www.gesmes.org/xml/2002-08-01"
+                 xmlns="http://www.ecb.int/vocabulary/2002-08-01/eurofxref">
+  <Cube>
+    <Cube time="2026-10-16">
+      <Cube currency="USD" rate="1.0812"/>
+      <Cube currency="RON" rate="4.9745"/>
+    </Cube>
+  </Cube>
+</gesmes:Envelope>"""
+
+
+class FakeResponse(io.BytesIO):
+    headers = {"ETag": '"abc"', "Last-Modified": "Fri, 16 Oct 2026 14:00:00 GMT"}
+
+
+@pytest.fixture
+def urlopen_calls(monkeypatch):
+    calls = []
+
+    def fake_urlopen(request, timeout=None, context=None):
+        calls.append({"url": request.full_url, "timeout": timeout, "context": context})
+        return FakeResponse(ECB_XML)
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    return calls
+
+
+def test_ssl_context_is_built_once():
+    assert ssl_context() is ssl_context()
+
+
+def test_refresh_passes_ssl_context(tmp_path, urlopen_calls):
+    service = RateService(base_url="https://example.test/", cache_path=str(tmp_path / "rates.json"))
+    snapshot = service.refresh()
+
+    assert len(urlopen_calls) == 1
+    assert urlopen_calls[0]["context"] is ssl_context()
+    assert snapshot.rates["RON"] == pytest.approx(4.9745)
+    assert snapshot.date == "2026-10-16"
+
+
+def test_history_update_passes_ssl_context(tmp_path, urlopen_calls):
+    rate_history = pytest.importorskip("rate_history")
+
+    history = rate_history.RateHistory(store_dir=str(tmp_path / "history"),
+                                       base_url="https://example.test/")
+    assert history.update(full=False) == 1
+
+    assert len(urlopen_calls) == 1
+    assert urlopen_calls[0]["url"].endswith(rate_history.HIST_90D_FILE)
+    assert urlopen_calls[0]["context"] is rate_service.ssl_context()
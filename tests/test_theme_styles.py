@@ -0,0 +1,100 @@
+"""
+ThemeManager.toggle_theme: o intrare care ridică o excepție nu oprește
+comutarea temei pentru celelalte widget-uri și callback-uri.
+"""
+
+import logging
+import os
+import sys
+import weakref
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("customtkinter")
+
+from theme_styles import ThemeManager  # noqa: E402
+
+
+class FakeWidget:
+    """Suficient pentru registrul de widget-uri: referință slabă și winfo_exists()"""
+
+    def __init__(self, exists=True):
+        self.exists = exists
+
+    def winfo_exists(self):
+        return self.exists
+
+
+@pytest.fixture
+def manager():
+    # Instanță nouă, separată de singleton-ul aplicației
+    instance = object.__new__(ThemeManager)
+    instance._initialized = False
+    instance.__init__()
+    return instance
+
+
+def add_widget(manager, widget, update_func):
+    token = next(manager._tokens)
+    manager._widgets[token] = (weakref.ref(widget), lambda: update_func)
+    return token
+
+
+def test_raising_callback_does_not_stop_the_others(manager, caplog):
+    seen = []
+
+    def broken(theme):
+        raise RuntimeError("widget pe jumătate distrus")
+
+    manager.on_theme_change(lambda theme: seen.append(("first", theme)))
+    manager.on_theme_change(broken)
+    manager.on_theme_change(lambda theme: seen.append(("last", theme)))
+
+    with caplog.at_level(logging.ERROR, logger="theme_styles"):
+        manager.toggle_theme()
+
+    assert seen == [("first", "light"), ("last", "light")]
+    assert "broken" in caplog.text
+    # Callback-ul care a eșuat rămâne înregistrat: nu e o intrare moartă
+    assert len(manager._callbacks) == 3
+
+
+def test_raising_widget_update_does_not_stop_the_others(manager, caplog):
+    updated = []
+    first, broken, last, dead = FakeWidget(), FakeWidget(), FakeWidget(), FakeWidget(exists=False)
+
+    def fail():
+        raise RuntimeError("TclError simulat")
+
+    add_widget(manager, first, lambda: updated.append("first"))
+    broken_token = add_widget(manager, broken, fail)
+    add_widget(manager, last, lambda: updated.append("last"))
+    dead_token = add_widget(manager, dead, lambda: updated.append("dead"))
+
+    with caplog.at_level(logging.ERROR, logger="theme_styles"):
+        manager.toggle_theme()
+
+    assert updated == ["first", "last"]
+    assert broken_token in manager._widgets
+    assert dead_token not in manager._widgets
+    assert "TclError simulat" in caplog.text
+
+
+def test_registry_stats_count_only_live_widgets(manager):
+    from profiling import StartupProfiler
+
+    alive, dead = FakeWidget(), FakeWidget()
+    add_widget(manager, alive, lambda: None)
+    add_widget(manager, dead, lambda: None)
+    manager.on_theme_change(lambda theme: None)
+    del dead
+
+    stats = manager.registry_stats()
+    assert stats == {"widgets": 1, "views": 0, "callbacks": 1}
+
+    profiler = StartupProfiler()
+    for name, value in stats.items():
+        profiler.count(f"theme:{name}", value)
+    assert profiler.to_dict()["counters"]["theme:widgets"] == 1
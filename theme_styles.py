@@ -3,8 +3,15 @@ ManuX Wealth OS - Partea 1: Teme și Stiluri (VERSIUNE ACTUALIZATĂ)
 """
 
 import customtkinter as ctk
+import inspect
+import itertools
+import logging
+import tkinter as tk
+import weakref
 from typing import Literal
 
+logger = logging.getLogger(__name__)
+
 # ═══════════════════════════════════════════════════════════════
 # 🎨 PALETĂ DE CULORI
 # ═══════════════════════════════════════════════════════════════
@@ -72,8 +79,46 @@ FONTS = {
 }
 
 
+# Opțiunile de culoare pe care le poate avea un widget customtkinter
+THEMED_OPTIONS = (
+    "fg_color", "bg_color", "text_color", "border_color", "hover_color",
+    "button_color", "button_hover_color", "progress_color",
+    "scrollbar_button_color", "dropdown_fg_color", "dropdown_text_color",
+)
+
+
+def _weak_callable(func):
+    """Referință slabă pentru metode legate (WeakMethod); funcțiile libere și
+    lambda-urile sunt păstrate normal, altfel ar dispărea imediat."""
+    if inspect.ismethod(func):
+        return weakref.WeakMethod(func)
+    return lambda: func
+
+
+def _build_style_tables() -> dict:
+    """Tabele precalculate {(tema_veche, tema_nouă): {culoare_veche: culoare_nouă}}.
+
+    Paletele dark/light au aceleași chei, deci fiecare culoare de temă are un
+    corespondent unic în cealaltă temă (comparația se face fără majuscule).
+    """
+    palettes = {"dark": COLORS_DARK, "light": COLORS_LIGHT}
+    tables = {}
+    for old_theme, old_palette in palettes.items():
+        for new_theme, new_palette in palettes.items():
+            if old_theme != new_theme:
+                tables[(old_theme, new_theme)] = {
+                    old_palette[key].lower(): new_palette[key] for key in old_palette
+                }
+    return tables
+
+
 class ThemeManager:
-    """Manager pentru tema aplicației cu suport real pentru schimbare"""
+    """Manager pentru tema aplicației cu suport real pentru schimbare.
+
+    View-urile înregistrate cu register_view sunt restilizate într-o singură
+    trecere (un configure per widget, din tabelele precalculate); cele ascunse
+    sunt restilizate abia când devin vizibile (apply_view din _show_view).
+    """
     
     _instance = None
     
@@ -88,8 +133,12 @@ class ThemeManager:
             return
         self._initialized = True
         self._current_theme = "dark"
-        self._callbacks = []
-        self._widgets = []
+        self._callbacks = []        # referințe slabe (WeakMethod) la callback-uri
+        self._widgets = {}          # token -> (weakref widget, referință update_func)
+        self._tokens = itertools.count()
+        self._views = weakref.WeakKeyDictionary()   # view -> tema în care e stilizat acum
+        self._style_tables = _build_style_tables()
+        self._class_options = {}    # clasă widget -> opțiunile de culoare suportate
     
     @property
     def is_dark(self) -> bool:
@@ -102,29 +151,153 @@ class ThemeManager:
         colors = self.get_colors()
         return colors.get(key, COLORS.get(key, "#FFFFFF"))
     
+    def resolve(self, color: str, theme: str = None) -> str:
+        """Culoarea din paleta dark (cu care sunt construite widget-urile) în tema dată.
+
+        Widget-urile care își aleg singure culorile la desenare (DataTable,
+        graficele) trec prin resolve cu tema în care e stilizat view-ul lor,
+        nu cu tema globală: un view ascuns rămâne în tema veche până la apply_view.
+        """
+        theme = theme or self._current_theme
+        if theme == "dark" or not isinstance(color, str):
+            return color
+        return self._style_tables[("dark", theme)].get(color.lower(), color)
+    
     def register_widget(self, widget, update_func):
-        """Înregistrează widget pentru actualizare la schimbarea temei"""
-        self._widgets.append((widget, update_func))
+        """Înregistrează widget pentru actualizare la schimbarea temei.
+
+        Registrul ține doar referințe slabe la widget (și la update_func, dacă e
+        metodă legată); intrarea dispare la <Destroy> sau când widget-ul e colectat.
+        """
+        token = next(self._tokens)
+        widget_ref = weakref.ref(widget, lambda _: self._widgets.pop(token, None))
+        self._widgets[token] = (widget_ref, _weak_callable(update_func))
+        tk.Misc.bind(widget, "<Destroy>", lambda e: self._on_widget_destroy(token, e), add="+")
+        return token
+    
+    def unregister_widget(self, token: int):
+        self._widgets.pop(token, None)
+    
+    @property
+    def live_widget_count(self) -> int:
+        """Numărul de widget-uri înregistrate încă în viață (pentru depanarea scurgerilor)"""
+        return sum(1 for widget_ref, _ in self._widgets.values() if widget_ref() is not None)
+    
+    def registry_stats(self) -> dict:
+        return {"widgets": self.live_widget_count, "views": len(self._views),
+                "callbacks": len(self._callbacks)}
+    
+    def _on_widget_destroy(self, token: int, event):
+        entry = self._widgets.get(token)
+        # <Destroy> vine și pentru ferestrele interne; contează doar widget-ul însuși
+        if entry and entry[0]() in (None, event.widget):
+            del self._widgets[token]
+    
+    def register_view(self, view, built_theme: str = "dark"):
+        """Înregistrează un view (construit cu paleta built_theme) pentru restilizare în lot"""
+        self._views[view] = built_theme
+        if view.winfo_ismapped():
+            self.apply_view(view)
+    
+    def apply_view(self, view):
+        """Aduce view-ul la tema curentă, dacă nu e deja; apelat înainte de afișare"""
+        applied = self._views.get(view, self._current_theme)
+        if applied == self._current_theme:
+            return
+        self._restyle_tree(view, self._style_tables[(applied, self._current_theme)], self._current_theme)
+        self._views[view] = self._current_theme
     
     def toggle_theme(self):
+        """Comută tema. O intrare care ridică o excepție e raportată în log și
+        sărită, ca restul view-urilor, widget-urilor și callback-urilor să
+        ajungă totuși în noua temă; sunt eliminate doar intrările moarte."""
         self._current_theme = "light" if self.is_dark else "dark"
         ctk.set_appearance_mode(self._current_theme)
         
-        # Actualizează toate widget-urile înregistrate
-        for widget, update_func in self._widgets[:]:
+        # O singură trecere pentru view-urile vizibile; restul la următorul apply_view
+        for view in list(self._views.keys()):
             try:
+                if view.winfo_exists() and view.winfo_ismapped():
+                    self.apply_view(view)
+            except Exception:
+                logger.exception("Restilizarea view-ului %r a eșuat", view)
+        
+        # Actualizează widget-urile înregistrate individual; cele distruse sunt eliminate
+        for token, (widget_ref, func_ref) in list(self._widgets.items()):
+            widget, update_func = widget_ref(), func_ref()
+            try:
+                if widget is None or update_func is None or not widget.winfo_exists():
+                    self._widgets.pop(token, None)
+                    continue
                 update_func()
-            except:
-                self._widgets.remove((widget, update_func))
+            except Exception:
+                logger.exception("Actualizarea temei pentru %r a eșuat", widget)
         
-        for callback in self._callbacks:
+        for func_ref in self._callbacks[:]:
+            callback = func_ref()
+            if callback is None:
+                self._callbacks.remove(func_ref)
+                continue
             try:
                 callback(self._current_theme)
-            except:
-                pass
+            except Exception:
+                logger.exception("Callback-ul de temă %r a eșuat", callback)
     
     def on_theme_change(self, callback):
-        self._callbacks.append(callback)
+        self._callbacks.append(_weak_callable(callback))
+    
+    def _themed_options(self, widget) -> tuple:
+        """Opțiunile de culoare ale clasei widget-ului, determinate o dată per clasă"""
+        cls = type(widget)
+        options = self._class_options.get(cls)
+        if options is None:
+            supported = []
+            for option in THEMED_OPTIONS:
+                try:
+                    widget.cget(option)
+                    supported.append(option)
+                except (ValueError, AttributeError, tk.TclError):
+                    pass
+            options = self._class_options[cls] = tuple(supported)
+        return options
+    
+    def _restyle_tree(self, root, table: dict, theme: str):
+        """Un singur configure per widget, cu toate culorile de temă traduse din tabel.
+
+        Întâi se citesc toate culorile, apoi se aplică: un CTkFrame își propagă
+        fg_color în bg_color-ul copiilor, iar o culoare deja tradusă nu trebuie
+        tradusă a doua oară (paletele dark/light își împart unele valori).
+        La final, widget-urile cu on_theme_applied(theme, table) (DataTable,
+        graficele) își actualizează starea proprie: culorile memorate pentru
+        desenare și elementele de canvas, pe care configure nu le atinge.
+        """
+        pending = []
+        hooks = []
+        stack = [root]
+        while stack:
+            widget = stack.pop()
+            stack.extend(widget.winfo_children())
+            if hasattr(widget, "on_theme_applied"):
+                hooks.append(widget)
+            
+            if isinstance(widget, ctk.CTkBaseClass):
+                changes = {}
+                for option in self._themed_options(widget):
+                    value = widget.cget(option)
+                    if isinstance(value, str) and value.lower() in table:
+                        changes[option] = table[value.lower()]
+                if changes:
+                    pending.append((widget, changes))
+            elif type(widget) is tk.Canvas:
+                # Canvas-urile graficelor (FanChart, LineChart); CTkCanvas intern e gestionat de ctk
+                value = widget.cget("bg")
+                if value.lower() in table:
+                    pending.append((widget, {"bg": table[value.lower()]}))
+        
+        for widget, changes in pending:
+            widget.configure(**changes)
+        for widget in hooks:
+            widget.on_theme_applied(theme, table)
 
 
 theme_manager = ThemeManager()
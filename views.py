@@ -3,14 +3,14 @@ ManuX Wealth OS - Module Views (Monte Carlo, Basket, FIRE, etc.)
 """
 
 import customtkinter as ctk
-import random
 import csv
 import os
 from datetime import datetime
 from typing import Callable
 
 from theme_styles import COLORS, COLORS_DARK, FONTS, theme_manager, format_currency, format_percentage, create_styled_button
-from widgets import CTkCard, CTkStatBox, CTkSliderWithLabel, CTkInputGroup, DataTable
+from widgets import CTkCard, CTkStatBox, CTkSliderWithLabel, CTkInputGroup, DataTable, FanChart, LineChart, BackgroundTask
+from simulation_engine import run_monte_carlo, run_fan_chart, FireSimulation, FIRE_HORIZON, FIRE_SIMULATIONS
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -26,6 +26,11 @@ class MonteCarloView(ctk.CTkScrollableFrame):
         self.get_params = get_params
         self.currency_var = currency_var
         self.columnconfigure((0,1), weight=1)
+        self._task = BackgroundTask(
+            self, self._simulate, on_done=self._on_run_done,
+            on_progress=self._on_run_progress, on_error=self._on_run_error,
+            on_cancel=self._on_run_finished
+        )
         self._create_ui()
     
     def _create_ui(self):
@@ -71,7 +76,7 @@ Această analiză îți oferă o imagine realistă a intervalului posibil de rez
         self.volatility.pack(padx=20, pady=5, fill="x")
         
         self.simulations = CTkSliderWithLabel(
-            params, label="Număr Simulări", from_=100, to=10000,
+            params, label="Număr Simulări", from_=100, to=100000,
             initial_value=1000, suffix="", progress_color=COLORS["cyan"]
         )
         self.simulations.pack(padx=20, pady=5, fill="x")
@@ -82,16 +87,26 @@ Această analiză îți oferă o imagine realistă a intervalului posibil de rez
         self.mc_inflation = CTkInputGroup(params, "Inflație Estimată (%)", "3", "3")
         self.mc_inflation.pack(padx=20, pady=5, fill="x")
         
-        run_btn = create_styled_button(params, "▶️ Rulează Simulare Monte Carlo", "purple", command=self._run)
-        run_btn.pack(padx=20, pady=20, fill="x")
+        self.seed_input = CTkInputGroup(params, "Seed (opțional, pentru reproducere exactă)", "aleator")
+        self.seed_input.pack(padx=20, pady=5, fill="x")
+        
+        self.run_btn = create_styled_button(params, "▶️ Rulează Simulare Monte Carlo", "purple", command=self._run)
+        self.run_btn.pack(padx=20, pady=20, fill="x")
         
         # Progres
         self.progress_frame = CTkCard(self, fg_color=COLORS["monte_carlo_card"])
         self.progress_frame.grid(row=3, column=0, columnspan=2, sticky="ew", pady=10, padx=10)
+        self.progress_frame.columnconfigure(0, weight=1)
         self.progress_frame.grid_remove()
         
         self.progress_bar = ctk.CTkProgressBar(self.progress_frame, progress_color=COLORS["purple"])
-        self.progress_bar.pack(padx=20, pady=20, fill="x")
+        self.progress_bar.grid(row=0, column=0, padx=20, pady=20, sticky="ew")
+        
+        self.cancel_btn = ctk.CTkButton(
+            self.progress_frame, text="⏹ Anulează", width=110, fg_color=COLORS["danger"],
+            hover_color=COLORS["danger_hover"], command=self._task.cancel
+        )
+        self.cancel_btn.grid(row=0, column=1, padx=(0,20), pady=20)
         
         # Rezultate principale
         self.p10 = CTkStatBox(self, "P10 (Pesimist)", "€ 0", "📉", COLORS["danger"])
@@ -128,6 +143,19 @@ Această analiză îți oferă o imagine realistă a intervalului posibil de rez
         self.success_label = ctk.CTkLabel(self.stats_frame, text="Succes: -", font=FONTS["mono_small"], text_color=COLORS["success"])
         self.success_label.grid(row=0, column=3, pady=5)
         
+        # Seed-ul rulării într-un entry read-only: poate fi selectat și copiat în câmpul Seed
+        ctk.CTkLabel(self.stats_frame, text="Seed:", font=FONTS["caption"],
+                     text_color=COLORS_DARK["text_secondary"]).grid(row=1, column=0, pady=(5,0), sticky="w")
+        self.seed_output = ctk.CTkEntry(self.stats_frame, font=FONTS["caption"], height=28,
+                                        fg_color=COLORS["monte_carlo_card"], border_width=0,
+                                        text_color=COLORS_DARK["text_secondary"])
+        self.seed_output.insert(0, "-")
+        self.seed_output.configure(state="readonly")
+        self.seed_output.grid(row=1, column=1, columnspan=3, pady=(5,0), sticky="ew")
+        
+        self.seed_label = ctk.CTkLabel(self.stats_frame, text="", font=FONTS["caption"], text_color=COLORS_DARK["text_secondary"])
+        self.seed_label.grid(row=2, column=0, columnspan=4, sticky="w")
+        
         # Percentile Table
         percentile_card = CTkCard(self, fg_color=COLORS["monte_carlo_card"])
         percentile_card.grid(row=7, column=0, columnspan=2, sticky="ew", pady=10, padx=10)
@@ -136,9 +164,31 @@ Această analiză îți oferă o imagine realistă a intervalului posibil de rez
         
         self.percentile_table = DataTable(percentile_card, columns=["Percentil", "Valoare", "vs Investit"], height=200)
         self.percentile_table.pack(padx=20, pady=(0,20), fill="x")
+        
+        # Fan chart - evoluția percentilelor pe ani
+        fan_card = CTkCard(self, fg_color=COLORS["monte_carlo_card"])
+        fan_card.grid(row=8, column=0, columnspan=2, sticky="ew", pady=10, padx=10)
+        
+        ctk.CTkLabel(fan_card, text="🌈 Evoluție Percentile pe Ani (P10–P90)", font=FONTS["subheader"]).pack(padx=20, pady=(20,10), anchor="w")
+        
+        self.fan_chart = FanChart(fan_card, bg_color=COLORS["monte_carlo_card"], accent_color=COLORS["purple"])
+        self.fan_chart.pack(padx=20, pady=(0,20), fill="x")
+    
+    @staticmethod
+    def _simulate(initial, monthly, years, rate, volatility, n_sims, seed=None,
+                  progress=None, cancel_event=None):
+        """Statisticile finale și benzile pe ani, din același seed (rulează pe thread-ul de lucru)"""
+        result = run_monte_carlo(initial, monthly, years, rate, volatility, n_sims, seed=seed,
+                                 progress=lambda f: progress(f / 2), cancel_event=cancel_event)
+        fan = run_fan_chart(initial, monthly, years, rate, volatility, n_sims, seed=result.seed,
+                            progress=lambda f: progress(0.5 + f / 2), cancel_event=cancel_event)
+        return result, fan
     
     def _run(self):
-        """Rulează simularea Monte Carlo"""
+        """Pornește simularea Monte Carlo pe un thread de lucru"""
+        if self._task.running:
+            return
+        
         params = self.get_params()
         initial = params["initial"]
         monthly = params["monthly"]
@@ -147,61 +197,76 @@ Această analiză îți oferă o imagine realistă a intervalului posibil de rez
         rate = self.expected_return.get_float() / 100
         volatility = self.volatility.get() / 100
         n_sims = int(self.simulations.get())
-        inflation = self.mc_inflation.get_float() / 100
         
-        total_invested = initial + monthly * 12 * years
+        seed_text = self.seed_input.get().strip()
+        if seed_text and not (seed_text.isascii() and seed_text.isdigit()):
+            # Un seed greșit nu devine o rulare aleatoare: reproducerea trebuie să fie exactă
+            self.success_label.configure(text="Eroare: seed-ul trebuie să fie un număr întreg pozitiv")
+            return
+        seed = int(seed_text) if seed_text else None
         
+        self.run_btn.configure(state="disabled")
         self.progress_frame.grid()
         self.progress_bar.set(0)
-        self.update()
-        
-        results = []
-        for i in range(n_sims):
-            total = initial
-            for year in range(years):
-                yearly_return = random.gauss(rate, volatility)
-                total = total * (1 + yearly_return) + monthly * 12
-            results.append(total)
-            
-            if i % 100 == 0:
-                self.progress_bar.set(i / n_sims)
-                self.update()
         
-        self.progress_bar.set(1)
+        self._task.start(initial, monthly, years, rate, volatility, n_sims, seed=seed)
+    
+    def _on_run_progress(self, fraction: float):
+        self.progress_bar.set(fraction)
+    
+    def _on_run_finished(self):
+        """Ascunde progresul și reactivează butonul (finalizare, anulare sau eroare)"""
         self.progress_frame.grid_remove()
+        self.run_btn.configure(state="normal")
+    
+    def _on_run_error(self, error: Exception):
+        self._on_run_finished()
+        self.success_label.configure(text=f"Eroare: {error}")
+    
+    def _on_run_done(self, outcome):
+        """Aplică rezultatele simulării pe statistici, tabel și fan chart"""
+        self._on_run_finished()
+        result, fan = outcome
         
-        results.sort()
         currency = self.currency_var.get()
-        
-        p10 = results[int(n_sims * 0.1)]
-        p25 = results[int(n_sims * 0.25)]
-        p50 = results[int(n_sims * 0.5)]
-        p75 = results[int(n_sims * 0.75)]
-        p90 = results[int(n_sims * 0.9)]
-        mean_val = sum(results) / n_sims
-        std_dev = (sum((x - mean_val) ** 2 for x in results) / n_sims) ** 0.5
-        
-        self.p10.set_value(format_currency(p10, currency))
-        self.p50.set_value(format_currency(p50, currency))
-        self.p90.set_value(format_currency(p90, currency))
-        self.mean.set_value(format_currency(mean_val, currency))
-        
-        self.std_label.configure(text=f"Std Dev: {format_currency(std_dev, currency)}")
-        self.min_label.configure(text=f"Min: {format_currency(min(results), currency)}")
-        self.max_label.configure(text=f"Max: {format_currency(max(results), currency)}")
-        
-        success_rate = sum(1 for r in results if r > total_invested) / n_sims * 100
-        self.success_label.configure(text=f"Succes: {success_rate:.1f}%")
+        total_invested = result.total_invested
+        pct = result.percentiles
+        
+        self.p10.set_value(format_currency(pct[10], currency))
+        self.p50.set_value(format_currency(pct[50], currency))
+        self.p90.set_value(format_currency(pct[90], currency))
+        self.mean.set_value(format_currency(result.mean, currency))
+        
+        self.std_label.configure(text=f"Std Dev: {format_currency(result.std, currency)}")
+        self.min_label.configure(text=f"Min: {format_currency(result.min, currency)}")
+        self.max_label.configure(text=f"Max: {format_currency(result.max, currency)}")
+        self.success_label.configure(text=f"Succes: {result.success_rate:.1f}%")
+        self.seed_output.configure(state="normal")
+        self.seed_output.delete(0, "end")
+        self.seed_output.insert(0, str(result.seed))
+        self.seed_output.configure(state="readonly")
+        run_info = f"{result.n_sims:,} scenarii | {result.workers} proces(e)"
+        if result.quantile_error:
+            run_info += f" | percentile ±{result.quantile_error * 100:.1f}% (streaming)"
+        self.seed_label.configure(text=run_info)
         
         # Percentile table
-        self.percentile_table.clear()
-        for pct, val in [(10, p10), (25, p25), (50, p50), (75, p75), (90, p90)]:
+        rows = []
+        for p, val in pct.items():
             vs_invested = ((val / total_invested) - 1) * 100
             color = COLORS["success"] if vs_invested > 0 else COLORS["danger"]
-            self.percentile_table.add_row(
-                [f"P{pct}", format_currency(val, currency), f"{vs_invested:+.1f}%"],
+            rows.append((
+                [f"P{p}", format_currency(val, currency), f"{vs_invested:+.1f}%"],
                 [COLORS_DARK["text_primary"], COLORS["accent"], color]
-            )
+            ))
+        self.percentile_table.update_rows(rows)
+        
+        start_year = datetime.now().year
+        self.fan_chart.set_data(
+            {p: fan.band(p) for p in fan.percentiles},
+            start_label=str(start_year), end_label=str(start_year + fan.years),
+            value_format=lambda v: format_currency(v, currency)
+        )
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -330,8 +395,9 @@ calculat de Institutul Național de Statistică (INS). Include:
     
     def _select_year(self, year):
         self.selected_year = year
-        self.year_2024_btn.configure(fg_color=COLORS["success"] if year == 2024 else COLORS_DARK["card_bg"])
-        self.year_2025_btn.configure(fg_color=COLORS["success"] if year == 2025 else COLORS_DARK["card_bg"])
+        idle = theme_manager.resolve(COLORS_DARK["card_bg"])     # view-ul e vizibil, deci în tema curentă
+        self.year_2024_btn.configure(fg_color=COLORS["success"] if year == 2024 else idle)
+        self.year_2025_btn.configure(fg_color=COLORS["success"] if year == 2025 else idle)
         self._update(self.family_picker.get())
         self._update_table()
     
@@ -362,16 +428,17 @@ calculat de Institutul Național de Statistică (INS). Include:
             )
     
     def _update_table(self):
-        self.comparison_table.clear()
         data = self.BASKET_DATA[self.selected_year]
+        rows = []
         
         for family, (ron, _) in data.items():
             eur = int(ron / self.EUR_RATE)
             annual = ron * 12
-            self.comparison_table.add_row(
+            rows.append((
                 [family, f"{ron:,}".replace(",", " "), f"€{eur}", f"{annual:,}".replace(",", " ")],
                 [COLORS_DARK["text_primary"], COLORS["success"], COLORS["accent"], COLORS_DARK["text_secondary"]]
-            )
+            ))
+        self.comparison_table.update_rows(rows)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -386,6 +453,7 @@ class FireView(ctk.CTkScrollableFrame):
         self.back_command = back_command
         self.currency_var = currency_var
         self.columnconfigure(0, weight=1)
+        self._fire_sim = None  # Matricea de scenarii se creează la prima rulare stocastică
         self._create_ui()
     
     def _create_ui(self):
@@ -433,18 +501,53 @@ Exemple:
         
         self.fire_return = CTkSliderWithLabel(
             inputs_card, label="Randament Așteptat (%)", from_=0, to=12,
-            initial_value=7, suffix="%", decimals=1, progress_color=COLORS["warning"]
+            initial_value=7, suffix="%", decimals=1, progress_color=COLORS["warning"],
+            command=self._on_param_change
         )
         self.fire_return.pack(padx=20, pady=5, fill="x")
         
         self.fire_inflation = CTkSliderWithLabel(
             inputs_card, label="Inflație (%)", from_=0, to=10,
-            initial_value=3, suffix="%", decimals=1, progress_color=COLORS["danger"]
+            initial_value=3, suffix="%", decimals=1, progress_color=COLORS["danger"],
+            command=self._on_param_change
         )
         self.fire_inflation.pack(padx=20, pady=5, fill="x")
         
+        self.fire_volatility = CTkSliderWithLabel(
+            inputs_card, label="Volatilitate Anuală (%) - mod stocastic", from_=0, to=30,
+            initial_value=15, suffix="%", decimals=0, progress_color=COLORS["purple"],
+            command=self._on_param_change
+        )
+        self.fire_volatility.pack(padx=20, pady=5, fill="x")
+        
+        self.stochastic_switch = ctk.CTkSwitch(
+            inputs_card, text=f"🎲 Mod stocastic (secvența randamentelor, {FIRE_SIMULATIONS:,} scenarii)".replace(",", " "),
+            font=FONTS["body"], progress_color=COLORS["warning"], command=self._on_param_change
+        )
+        self.stochastic_switch.pack(padx=20, pady=(10,5), anchor="w")
+        
         sim_btn = create_styled_button(inputs_card, "⚡ Simulează Pensionare", "warning", command=self._simulate)
-        sim_btn.pack(padx=20, pady=20, fill="x")
+        sim_btn.pack(padx=20, pady=(20,10), fill="x")
+        
+        # Solver retragere maximă
+        solver_frame = ctk.CTkFrame(inputs_card, fg_color="transparent")
+        solver_frame.pack(padx=20, pady=(0,20), fill="x")
+        solver_frame.columnconfigure(1, weight=1)
+        
+        ctk.CTkLabel(solver_frame, text="Țintă succes:", font=FONTS["section_title"]).grid(row=0, column=0, padx=(0,10))
+        
+        self.target_success = ctk.CTkOptionMenu(
+            solver_frame, values=["90%", "95%", "99%"], width=90,
+            fg_color=COLORS_DARK["card_bg"], button_color=COLORS["warning"]
+        )
+        self.target_success.set("95%")
+        self.target_success.grid(row=0, column=1, sticky="w")
+        
+        create_styled_button(solver_frame, f"🎯 Retragere Maximă ({FIRE_HORIZON} ani)", "secondary",
+                             command=self._solve_withdrawal).grid(row=0, column=2, sticky="e")
+        
+        self.solver_label = ctk.CTkLabel(inputs_card, text="", font=FONTS["caption"], text_color=COLORS_DARK["text_secondary"])
+        self.solver_label.pack(padx=20, pady=(0,10), anchor="w")
         
         # Rezultate
         results_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -478,6 +581,105 @@ Exemple:
         
         self.yearly_table = DataTable(yearly_card, columns=["An", "Sold Inițial", "Retragere", "Sold Final"], height=250)
         self.yearly_table.pack(padx=20, pady=(0,20), fill="x")
+        
+        # Rezultate stocastice (sequence-of-returns)
+        self.stochastic_card = CTkCard(self, fg_color=COLORS["fire_card"])
+        self.stochastic_card.grid(row=6, column=0, sticky="ew", pady=10, padx=10)
+        self.stochastic_card.grid_remove()
+        
+        ctk.CTkLabel(self.stochastic_card, text="🎲 Analiză Stocastică (Monte Carlo)", font=FONTS["subheader"]).pack(padx=20, pady=(20,10), anchor="w")
+        
+        stoch_stats = ctk.CTkFrame(self.stochastic_card, fg_color="transparent")
+        stoch_stats.pack(padx=10, fill="x")
+        stoch_stats.columnconfigure((0,1), weight=1)
+        
+        self.success_stat = CTkStatBox(stoch_stats, f"Succes {FIRE_HORIZON} ani", "-", "🎯", COLORS["success"])
+        self.success_stat.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        
+        self.depletion_stat = CTkStatBox(stoch_stats, "An Median Epuizare", "-", "⏳", COLORS["danger"])
+        self.depletion_stat.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        
+        self.swr90_stat = CTkStatBox(stoch_stats, "Rată Sigură (90%)", "-", "🛡️", COLORS["accent"])
+        self.swr90_stat.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
+        
+        self.swr95_stat = CTkStatBox(stoch_stats, "Rată Sigură (95%)", "-", "🛡️", COLORS["purple"])
+        self.swr95_stat.grid(row=1, column=1, padx=10, pady=10, sticky="nsew")
+        
+        ctk.CTkLabel(self.stochastic_card, text="Probabilitate de epuizare până în anul N", font=FONTS["section_title"],
+                     text_color=COLORS_DARK["text_secondary"]).pack(padx=20, pady=(10,0), anchor="w")
+        
+        self.ruin_chart = LineChart(self.stochastic_card, bg_color=COLORS["fire_card"])
+        self.ruin_chart.pack(padx=20, pady=(0,20), fill="x")
+    
+    def _on_param_change(self, *_):
+        """Redesenează analiza stocastică la fiecare schimbare de parametri (slider, switch)"""
+        if self.stochastic_switch.get():
+            self.stochastic_card.grid()
+            self._update_stochastic()
+        else:
+            self.stochastic_card.grid_remove()
+    
+    def _solve_withdrawal(self):
+        """Caută retragerea lunară maximă pentru ținta de succes și o completează în formular"""
+        portfolio = self.portfolio.get_float()
+        if portfolio <= 0:
+            return
+        
+        if self._fire_sim is None:
+            self._fire_sim = FireSimulation()
+        
+        # În modul determinist toate scenariile sunt identice (volatilitate 0)
+        stochastic = bool(self.stochastic_switch.get())
+        target = float(self.target_success.get().rstrip("%"))
+        annual = self._fire_sim.solve_withdrawal(
+            portfolio,
+            rate=self.fire_return.get() / 100,
+            volatility=self.fire_volatility.get() / 100 if stochastic else 0.0,
+            inflation=self.fire_inflation.get() / 100,
+            target_success=target
+        )
+        
+        monthly = int(annual / 12)
+        currency = self.currency_var.get()
+        self.monthly_withdrawal.set(str(monthly))
+        mode = f"{target:.0f}% din scenarii" if stochastic else "determinist"
+        self.solver_label.configure(
+            text=f"Retragere maximă {FIRE_HORIZON} ani ({mode}): {format_currency(monthly, currency)}/lună "
+                 f"= {annual / portfolio * 100:.2f}% din portofoliu"
+        )
+        self._simulate()
+    
+    def _update_stochastic(self):
+        """Rulează scenariile FIRE pe matricea pre-extrasă și actualizează statisticile"""
+        portfolio = self.portfolio.get_float()
+        annual_withdrawal = self.monthly_withdrawal.get_float() * 12
+        if portfolio <= 0:
+            return
+        
+        if self._fire_sim is None:
+            self._fire_sim = FireSimulation()
+        
+        result = self._fire_sim.run(
+            portfolio, annual_withdrawal,
+            rate=self.fire_return.get() / 100,
+            volatility=self.fire_volatility.get() / 100,
+            inflation=self.fire_inflation.get() / 100
+        )
+        
+        self.success_stat.set_value(f"{result.success_rate:.1f}%")
+        self.success_stat.set_accent(COLORS["success"] if result.success_rate >= 90 else COLORS["danger"])
+        if result.median_depletion_year is None:
+            self.depletion_stat.set_value(f"{self._fire_sim.years}+ ani")
+        else:
+            self.depletion_stat.set_value(f"~{result.median_depletion_year:.0f} ani")
+        self.swr90_stat.set_value(f"{result.safe_withdrawal_rates[90]:.2f}%")
+        self.swr95_stat.set_value(f"{result.safe_withdrawal_rates[95]:.2f}%")
+        
+        self.ruin_chart.set_series(
+            {"Probabilitate epuizare": (result.ruin_by_year, COLORS["danger"])},
+            start_label="An 0", end_label=f"An {self._fire_sim.years}",
+            value_format=lambda v: f"{v:.0f}%", y_range=(0, 100)
+        )
     
     def _simulate(self):
         portfolio = self.portfolio.get_float()
@@ -497,7 +699,7 @@ Exemple:
         # Simulare
         balance = portfolio
         years = 0
-        self.yearly_table.clear()
+        rows = []
         
         current_withdrawal = annual_withdrawal
         
@@ -509,16 +711,18 @@ Exemple:
             
             if years <= 30:
                 color = COLORS["success"] if balance > 0 else COLORS["danger"]
-                self.yearly_table.add_row(
+                rows.append((
                     [str(years), format_currency(start_balance, currency), 
                      format_currency(current_withdrawal / (1 + inflation), currency),
                      format_currency(max(0, balance), currency)],
                     [COLORS_DARK["text_primary"], COLORS["accent"], COLORS["warning"], color]
-                )
+                ))
             
             if balance <= 0:
                 break
         
+        self.yearly_table.update_rows(rows)
+        
         if years >= 30:
             self.years_stat.set_value("30+ ani ✓")
             self.years_stat.set_accent(COLORS["success"])
@@ -533,3 +737,5 @@ Exemple:
                 text=f"⚠️ ATENȚIE! Portofoliul se epuizează în ~{years} ani. Redu retragerea sau mărește capitalul.",
                 text_color=COLORS["danger"]
             )
+        
+        self._on_param_change()
@@ -184,7 +184,6 @@ class RealEstateView(ctk.CTkScrollableFrame):
         self.annual_cashflow.set_value(format_currency(net_cashflow, currency))
         
         # Table
-        self.details_table.clear()
         rows = [
             ("Chirie Brută", rent, gross_rent_annual, COLORS["success"]),
             ("(-) Vacanță", vacancy_loss/12, vacancy_loss, COLORS["warning"]),
@@ -195,11 +194,11 @@ class RealEstateView(ctk.CTkScrollableFrame):
             ("= Cashflow Net", net_cashflow/12, net_cashflow, COLORS["success"] if net_cashflow > 0 else COLORS["danger"]),
         ]
         
-        for cat, monthly, annual, color in rows:
-            self.details_table.add_row(
-                [cat, format_currency(monthly, currency), format_currency(annual, currency)],
-                [COLORS_DARK["text_primary"], color, color]
-            )
+        self.details_table.update_rows(
+            ([cat, format_currency(monthly, currency), format_currency(annual, currency)],
+             [COLORS_DARK["text_primary"], color, color])
+            for cat, monthly, annual, color in rows
+        )
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -321,7 +320,7 @@ Rebalansarea:
         self._update_table()
     
     def _update_table(self):
-        self.assets_table.clear()
+        rows = []
         total = sum(a["current"] for a in self.assets)
         currency = self.currency_var.get()
         
@@ -340,13 +339,15 @@ Rebalansarea:
                 action = "OK ✓"
                 color = COLORS["success"]
             
-            self.assets_table.add_row(
+            rows.append((
                 [asset["name"], format_currency(asset["current"], currency), 
                  f"{current_pct:.1f}%", format_currency(total * target_pct / 100, currency),
                  f"{target_pct:.0f}%", action],
                 [COLORS_DARK["text_primary"], COLORS["accent"], COLORS["purple"], 
                  COLORS["warning"], COLORS["warning"], color]
-            )
+            ))
+        
+        self.assets_table.update_rows(rows)
     
     def _calculate(self):
         total = self.total_portfolio.get_float()
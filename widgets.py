@@ -6,15 +6,23 @@ Componente reutilizabile:
 - CTkCard, CTkStatBox, CTkSliderWithLabel
 - CTkInputGroup, NavigationButton
 - SidebarSection, ProgressIndicator
+- DataTable, LineChart, FanChart, BackgroundTask, Debouncer
 """
 
 import customtkinter as ctk
+import sys
+import threading
+import time
+import tkinter as tk
 from typing import Callable, Optional, Literal
+from lazy_imports import lazy_import
 from theme_styles import (
     COLORS, COLORS_DARK, FONTS, BUTTON_STYLES,
     theme_manager, format_currency, format_percentage
 )
 
+np = lazy_import("numpy")  # doar pentru decimarea LineChart
+
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -296,7 +304,7 @@ class NavigationButton(ctk.CTkButton):
         self.configure(text_color="white")
     
     def _on_hover_leave(self, event):
-        self.configure(text_color=COLORS_DARK["text_primary"])
+        self.configure(text_color=theme_manager.resolve(COLORS_DARK["text_primary"]))
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -389,14 +397,29 @@ class ProgressIndicator(ctk.CTkFrame):
 
 
 # ═══════════════════════════════════════════════════════════════
-# 📋 DataTable - Tabel simplu pentru date
+# 📋 DataTable - Tabel virtualizat pentru date
 # ═══════════════════════════════════════════════════════════════
 
-class DataTable(ctk.CTkScrollableFrame):
-    """Tabel scrollable pentru afișarea datelor"""
+class DataTable(ctk.CTkFrame):
+    """Tabel virtualizat: un număr fix de rânduri de label-uri reciclate.
+
+    Datele vin dintr-o sursă (număr de rânduri + funcție row_getter(i) ->
+    (valori, culori)); la scroll sunt reconfigurate doar label-urile din
+    fereastra vizibilă, deci costul nu depinde de numărul total de rânduri.
+    Tabelele mici se actualizează cu update_rows(); add_row / clear rămân
+    pentru compatibilitate. Un label primește configure() doar dacă textul
+    sau culoarea lui s-au schimbat față de ultima desenare.
+
+    Culorile primite de la sursă sunt din paleta dark; la desenare sunt
+    traduse în tema în care e stilizat tabelul (theme_manager.resolve), iar
+    starea celulelor memorează culoarea tradusă, cea afișată efectiv.
+    """
+    
+    ROW_HEIGHT = 28
     
     def __init__(self, parent, 
                  columns: list[str],
+                 height: int = 300,
                  **kwargs):
         
         super().__init__(
@@ -408,10 +431,15 @@ class DataTable(ctk.CTkScrollableFrame):
         
         self._columns = columns
         self._rows = []
+        self._count = 0
+        self._row_getter = None
+        self._offset = 0
+        self._render_pending = None
+        self._theme = "dark"        # tema în care sunt stilizate celulele
         
-        # Setup grid columns
+        # Setup grid columns (uniform: lățimile nu sar la scroll)
         for i in range(len(columns)):
-            self.columnconfigure(i, weight=1)
+            self.columnconfigure(i, weight=1, uniform="datatable")
         
         # Header row
         for i, col in enumerate(columns):
@@ -422,29 +450,299 @@ class DataTable(ctk.CTkScrollableFrame):
                 text_color=COLORS_DARK["text_secondary"]
             )
             header.grid(row=0, column=i, padx=8, pady=8, sticky="w")
+        
+        # Rândurile vizibile - create o singură dată și refolosite
+        visible = max(1, (height - 44) // self.ROW_HEIGHT)
+        self._cells = []
+        self._cell_state = []
+        for r in range(visible):
+            row_cells = []
+            for i in range(len(columns)):
+                cell = ctk.CTkLabel(
+                    self,
+                    text="",
+                    height=self.ROW_HEIGHT,
+                    font=FONTS["mono_small"],
+                    text_color=COLORS_DARK["text_primary"]
+                )
+                cell.grid(row=r + 1, column=i, padx=8, pady=0, sticky="w")
+                self._bind_wheel(cell)
+                row_cells.append(cell)
+            self._cells.append(row_cells)
+            self._cell_state.append([("", COLORS_DARK["text_primary"])] * len(columns))
+        
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=len(columns), rowspan=visible, sticky="ns", padx=(0, 4), pady=(0, 8))
+        self._bind_wheel(self)
+        self._update_scrollbar()
+    
+    @property
+    def visible_rows(self) -> int:
+        return len(self._cells)
+    
+    def set_source(self, count: int, row_getter: Callable):
+        """Leagă tabelul de o sursă de date: row_getter(i) -> (valori, culori)"""
+        self._count = count
+        self._row_getter = row_getter
+        self._offset = min(self._offset, self._max_offset())
+        self._render()
+    
+    def update_rows(self, rows: list[tuple]):
+        """Înlocuiește conținutul cu rows = [(valori, culori), ...].
+        Celulele existente sunt refolosite; se reconfigurează doar cele modificate."""
+        self._rows = list(rows)
+        self._count = len(self._rows)
+        self._row_getter = self._rows.__getitem__
+        self._offset = min(self._offset, self._max_offset())
+        self._render()
     
     def add_row(self, values: list[str], colors: list[str] = None):
         """Adaugă un rând în tabel"""
-        row_idx = len(self._rows) + 1
-        self._rows.append(values)
-        
-        for i, val in enumerate(values):
-            color = colors[i] if colors and i < len(colors) else COLORS_DARK["text_primary"]
-            
-            cell = ctk.CTkLabel(
-                self,
-                text=val,
-                font=FONTS["mono_small"],
-                text_color=color
-            )
-            cell.grid(row=row_idx, column=i, padx=8, pady=4, sticky="w")
+        self._rows.append((values, colors))
+        self._count = len(self._rows)
+        self._row_getter = self._rows.__getitem__
+        self._schedule_render()
     
     def clear(self):
         """Șterge toate rândurile"""
-        for widget in self.winfo_children():
-            if int(widget.grid_info().get("row", 0)) > 0:
-                widget.destroy()
         self._rows = []
+        self._count = 0
+        self._row_getter = None
+        self._offset = 0
+        self._schedule_render()
+    
+    def scroll_to(self, index: int):
+        """Derulează astfel încât rândul index să fie primul vizibil"""
+        self._offset = max(0, min(int(index), self._max_offset()))
+        self._render()
+    
+    def _max_offset(self) -> int:
+        return max(0, self._count - self.visible_rows)
+    
+    def _schedule_render(self):
+        # add_row repetat -> o singură redesenare la final
+        if self._render_pending is None:
+            self._render_pending = self.after_idle(self._render)
+    
+    def _render(self):
+        if self._render_pending is not None:
+            self.after_cancel(self._render_pending)
+            self._render_pending = None
+        
+        resolve = theme_manager.resolve
+        default_color = resolve(COLORS_DARK["text_primary"], self._theme)
+        for r, (row_cells, row_state) in enumerate(zip(self._cells, self._cell_state)):
+            index = self._offset + r
+            if index < self._count:
+                values, colors = self._row_getter(index)
+            else:
+                values, colors = (), None
+            for i, cell in enumerate(row_cells):
+                text = values[i] if i < len(values) else ""
+                color = resolve(colors[i], self._theme) if colors and i < len(colors) else default_color
+                if row_state[i] != (text, color):
+                    cell.configure(text=text, text_color=color)
+                    row_state[i] = (text, color)
+        self._update_scrollbar()
+    
+    def on_theme_applied(self, theme: str, table: dict):
+        """Apelat de ThemeManager după restilizarea view-ului: celulele au fost
+        deja traduse cu table, deci starea memorată se traduce la fel"""
+        self._theme = theme
+        for row_state in self._cell_state:
+            for i, (text, color) in enumerate(row_state):
+                row_state[i] = (text, table.get(color.lower(), color))
+    
+    def _update_scrollbar(self):
+        if self._count <= self.visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self._offset / self._count,
+                               (self._offset + self.visible_rows) / self._count)
+    
+    def _on_scrollbar(self, action: str, value, unit: str = None):
+        if action == "moveto":
+            self.scroll_to(round(float(value) * self._count))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_to(self._offset + int(value) * step)
+    
+    def _on_wheel(self, event):
+        if sys.platform.startswith("win"):
+            delta = -int(event.delta / 40)
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        elif event.delta:
+            # X11 cu Tk ≥ 8.7: <MouseWheel> cu delta, num este "??"
+            delta = -1 if event.delta > 0 else 1
+        elif event.num in (4, 5):
+            delta = -1 if event.num == 4 else 1
+        else:
+            return "break"
+        self.scroll_to(self._offset + delta)
+        # Pagina (CTkScrollableFrame) leagă rotița cu bind_all; tabelul o consumă
+        return "break"
+    
+    def _bind_wheel(self, widget):
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_wheel)
+
+
+# ═══════════════════════════════════════════════════════════════
+# 📈 LineChart - Grafic cu linii pe tk.Canvas
+# ═══════════════════════════════════════════════════════════════
+
+def decimate_minmax(values, columns: int) -> tuple:
+    """Reduce o serie la cel mult 2 puncte (min, max) per coloană de pixeli.
+
+    Returnează (indici, valori) ca array-uri; vârfurile și minimele locale se
+    păstrează, deci forma liniei desenate nu se schimbă față de seria completă.
+    """
+    values = np.asarray(values, dtype=float)
+    n = values.size
+    if n <= 2 * columns:
+        return np.arange(n, dtype=float), values
+    
+    starts = np.linspace(0, n, columns + 1).astype(np.int64)[:-1]
+    ends = np.append(starts[1:], n)
+    low = np.minimum.reduceat(values, starts)
+    high = np.maximum.reduceat(values, starts)
+    # Pe coloanele crescătoare minimul vine înaintea maximului și invers
+    rising = values[ends - 1] >= values[starts]
+    first = np.where(rising, low, high)
+    second = np.where(rising, high, low)
+    
+    index = np.repeat(starts.astype(float), 2)
+    index[1::2] = ends - 1
+    decimated = np.empty(2 * columns)
+    decimated[0::2] = first
+    decimated[1::2] = second
+    return index, decimated
+
+
+class LineChart(ctk.CTkFrame):
+    """Grafic cu mai multe serii desenate ca polilinii pe un singur tk.Canvas.
+
+    Elementele canvas-ului sunt create o singură dată per serie; la date noi
+    sau la redimensionare se actualizează doar coordonatele (canvas.coords).
+    Seriile lungi sunt decimate min/max la lățimea în pixeli a graficului.
+    Elementele canvas-ului sunt recolorate de on_theme_applied la schimbarea temei.
+    """
+    
+    PAD_LEFT = 90
+    PAD_RIGHT = 20
+    PAD_TOP = 30
+    PAD_BOTTOM = 24
+    
+    def __init__(self, parent,
+                 bg_color: str = None,
+                 height: int = 240,
+                 **kwargs):
+        
+        super().__init__(parent, fg_color="transparent", **kwargs)
+        
+        self._bg_color = bg_color or COLORS_DARK["card_bg"]
+        self._theme = "dark"
+        self._data = None
+        self._lines = {}
+        self._legend = {}
+        
+        self.canvas = tk.Canvas(self, height=height, bg=self._bg_color, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.canvas.bind("<Configure>", lambda e: self._redraw())
+        
+        text_color = COLORS_DARK["text_secondary"]
+        font = FONTS["small"]
+        self._axis = self.canvas.create_line(0, 0, 0, 0, fill=COLORS["border"])
+        self._labels = {
+            key: self.canvas.create_text(0, 0, text="", anchor=anchor, fill=text_color, font=font)
+            for key, anchor in (("high", "e"), ("low", "e"), ("start", "sw"), ("end", "se"))
+        }
+    
+    def set_series(self, series: dict, start_label: str = "", end_label: str = "",
+                   value_format: Callable = str, y_range: tuple = None):
+        """Setează seriile: {nume: (valori, culoare)}, toate de aceeași lungime.
+        y_range=(min, max) fixează axa verticală (implicit de la 0 la maximul datelor)."""
+        self._data = (series, start_label, end_label, value_format, y_range)
+        
+        for name in list(self._lines):
+            if name not in series:
+                self.canvas.delete(self._lines.pop(name), self._legend.pop(name))
+        for name, (_, color) in series.items():
+            if name not in self._lines:
+                self._lines[name] = self.canvas.create_line(0, 0, 0, 0, width=2)
+                self._legend[name] = self.canvas.create_text(
+                    0, 0, anchor="w", font=FONTS["small"], text=f"● {name}")
+            color = theme_manager.resolve(color, self._theme)
+            self.canvas.itemconfigure(self._lines[name], fill=color)
+            self.canvas.itemconfigure(self._legend[name], fill=color)
+        
+        self._redraw()
+    
+    def on_theme_applied(self, theme: str, table: dict):
+        """Apelat de ThemeManager după restilizare: fundalul canvas-ului e tradus
+        de restilizare, etichetele și seriile sunt recolorate aici"""
+        self._theme = theme
+        text_color = theme_manager.resolve(COLORS_DARK["text_secondary"], theme)
+        for item in self._labels.values():
+            self.canvas.itemconfigure(item, fill=text_color)
+        if self._data:
+            for name, (_, color) in self._data[0].items():
+                color = theme_manager.resolve(color, theme)
+                self.canvas.itemconfigure(self._lines[name], fill=color)
+                self.canvas.itemconfigure(self._legend[name], fill=color)
+    
+    def _redraw(self):
+        if not self._data:
+            return
+        series, start_label, end_label, value_format, y_range = self._data
+        
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        plot_w = width - self.PAD_LEFT - self.PAD_RIGHT
+        plot_h = height - self.PAD_TOP - self.PAD_BOTTOM
+        if plot_w <= 0 or plot_h <= 0 or not series:
+            return
+        
+        arrays = {name: np.asarray(values, dtype=float) for name, (values, _) in series.items()}
+        n = max(a.size for a in arrays.values())
+        if n == 0:
+            return
+        if y_range:
+            low, high = y_range
+        else:
+            low = min(0.0, min(float(a.min()) for a in arrays.values() if a.size))
+            high = max(float(a.max()) for a in arrays.values() if a.size)
+        span = (high - low) or 1.0
+        
+        for name, values in arrays.items():
+            if values.size == 0:
+                self.canvas.coords(self._lines[name], 0, 0, 0, 0)
+                continue
+            index, decimated = decimate_minmax(values, int(plot_w))
+            if index.size == 1:
+                # Un singur punct -> linie orizontală pe toată lățimea
+                index, decimated = np.array([0.0, n - 1.0]), np.repeat(decimated, 2)
+            coords = np.empty(2 * index.size)
+            coords[0::2] = self.PAD_LEFT + plot_w * index / max(1, n - 1)
+            coords[1::2] = self.PAD_TOP + plot_h * (1 - (decimated - low) / span)
+            self.canvas.coords(self._lines[name], coords.tolist())
+        
+        x = self.PAD_LEFT
+        for name in series:
+            self.canvas.coords(self._legend[name], x, self.PAD_TOP / 2)
+            x = self.canvas.bbox(self._legend[name])[2] + 16
+        
+        bottom = self.PAD_TOP + plot_h
+        self.canvas.coords(self._axis, self.PAD_LEFT, bottom, width - self.PAD_RIGHT, bottom)
+        for key, x, y, text in (
+            ("high", self.PAD_LEFT - 8, self.PAD_TOP, value_format(high)),
+            ("low", self.PAD_LEFT - 8, bottom, value_format(low)),
+            ("start", self.PAD_LEFT, height - 4, start_label),
+            ("end", width - self.PAD_RIGHT, height - 4, end_label),
+        ):
+            self.canvas.coords(self._labels[key], x, y)
+            self.canvas.itemconfigure(self._labels[key], text=text)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -457,15 +755,20 @@ class ToastNotification:
     def __init__(self, parent):
         self.parent = parent
         self._toast = None
+        self._message_label = None
+        self._hide_job = None
     
     def show(self, message: str, 
              type_: Literal["success", "error", "warning", "info"] = "info",
              duration: int = 3000):
-        """Afișează o notificare toast"""
+        """Afișează o notificare toast; duration=0 o păstrează până la următoarea"""
         
         # Închide toast-ul anterior dacă există
         if self._toast:
             self._toast.destroy()
+        if self._hide_job:
+            self.parent.after_cancel(self._hide_job)
+            self._hide_job = None
         
         colors = {
             "success": COLORS["success"],
@@ -502,14 +805,22 @@ class ToastNotification:
             text_color="white"
         )
         msg_label.pack(side="left", padx=(0, 16), pady=12)
+        self._message_label = msg_label
         
         # Poziționare în dreapta jos
         self._toast.place(relx=0.98, rely=0.98, anchor="se")
         
         # Auto-hide după duration ms
-        self.parent.after(duration, self._hide_toast)
+        if duration > 0:
+            self._hide_job = self.parent.after(duration, self._hide_toast)
+    
+    def update(self, message: str):
+        """Schimbă textul toast-ului curent (ex. progres), fără a-l recrea"""
+        if self._toast and self._toast.winfo_exists():
+            self._message_label.configure(text=message)
     
     def _hide_toast(self):
+        self._hide_job = None
         if self._toast:
             self._toast.destroy()
             self._toast = None
@@ -543,6 +854,264 @@ class TagBadge(ctk.CTkFrame):
         self.label.pack(padx=10, pady=4)
 
 
+# ═══════════════════════════════════════════════════════════════
+# 🌈 FanChart - Grafic cu benzi de percentile (Monte Carlo)
+# ═══════════════════════════════════════════════════════════════
+
+class FanChart(ctk.CTkFrame):
+    """Grafic fan desenat pe un singur tk.Canvas.
+
+    Primește benzile ca secvențe paralele (o serie per percentilă, aceeași
+    lungime) și desenează banda exterioară, banda interioară și mediana.
+    Culorile de temă sunt rezolvate la fiecare desenare, în tema view-ului.
+    """
+    
+    PAD_LEFT = 90
+    PAD_RIGHT = 20
+    PAD_Y = 20
+    
+    def __init__(self, parent,
+                 bg_color: str = None,
+                 accent_color: str = None,
+                 height: int = 260,
+                 **kwargs):
+        
+        super().__init__(parent, fg_color="transparent", **kwargs)
+        
+        self._bg_color = bg_color or COLORS_DARK["card_bg"]
+        self._accent = accent_color or COLORS["purple"]
+        self._theme = "dark"
+        self._data = None
+        
+        self.canvas = tk.Canvas(self, height=height, bg=self._bg_color, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.canvas.bind("<Configure>", lambda e: self._redraw())
+    
+    def set_data(self, bands: dict, start_label: str = "", end_label: str = "",
+                 value_format: Callable = str, y_range: tuple = None):
+        """Setează benzile: {percentilă: serie}; sunt folosite 10/25/50/75/90 dacă există.
+        y_range=(min, max) fixează axa verticală (implicit intervalul datelor)."""
+        self._data = (bands, start_label, end_label, value_format, y_range)
+        self._redraw()
+    
+    def _redraw(self):
+        self.canvas.delete("all")
+        if not self._data:
+            return
+        bands, start_label, end_label, value_format, y_range = self._data
+        
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        plot_w = width - self.PAD_LEFT - self.PAD_RIGHT
+        plot_h = height - 2 * self.PAD_Y
+        if plot_w <= 0 or plot_h <= 0:
+            return
+        
+        series = list(bands.values())
+        n = len(series[0])
+        if y_range:
+            low, high = y_range
+        else:
+            low = min(min(s) for s in series)
+            high = max(max(s) for s in series)
+        span = (high - low) or 1.0
+        
+        def points(values):
+            coords = []
+            for i, v in enumerate(values):
+                coords.append(self.PAD_LEFT + plot_w * i / max(1, n - 1))
+                coords.append(self.PAD_Y + plot_h * (1 - (v - low) / span))
+            return coords
+        
+        def band_polygon(lower, upper):
+            lo = points(lower)
+            up = points(upper)
+            # Conturul superior de la stânga la dreapta, apoi cel inferior înapoi
+            back = [c for i in range(len(lo) - 2, -1, -2) for c in lo[i:i + 2]]
+            return up + back
+        
+        if 10 in bands and 90 in bands:
+            self.canvas.create_polygon(band_polygon(bands[10], bands[90]),
+                                       fill=self._accent, stipple="gray25", outline="")
+        if 25 in bands and 75 in bands:
+            self.canvas.create_polygon(band_polygon(bands[25], bands[75]),
+                                       fill=self._accent, stipple="gray50", outline="")
+        if 50 in bands:
+            self.canvas.create_line(points(bands[50]), width=2,
+                                    fill=theme_manager.resolve(COLORS_DARK["text_primary"], self._theme))
+        
+        text_color = theme_manager.resolve(COLORS_DARK["text_secondary"], self._theme)
+        font = FONTS["small"]
+        self.canvas.create_text(self.PAD_LEFT - 8, self.PAD_Y, text=value_format(high),
+                                anchor="e", fill=text_color, font=font)
+        self.canvas.create_text(self.PAD_LEFT - 8, self.PAD_Y + plot_h, text=value_format(low),
+                                anchor="e", fill=text_color, font=font)
+        self.canvas.create_text(self.PAD_LEFT, height - 4, text=start_label,
+                                anchor="sw", fill=text_color, font=font)
+        self.canvas.create_text(width - self.PAD_RIGHT, height - 4, text=end_label,
+                                anchor="se", fill=text_color, font=font)
+    
+    def on_theme_applied(self, theme: str, table: dict):
+        """Apelat de ThemeManager după restilizare: redesenează în noua temă"""
+        self._theme = theme
+        self._redraw()
+
+
+# ═══════════════════════════════════════════════════════════════
+# ⚙️ BackgroundTask - Calcul în fundal cu progres prin after()
+# ═══════════════════════════════════════════════════════════════
+
+class BackgroundTask:
+    """Rulează o funcție pe un thread separat fără a bloca bucla Tk.
+
+    Funcția primește argumentele cheie progress(fracțiune) și cancel_event;
+    progresul, rezultatul și erorile sunt livrate pe thread-ul Tk prin
+    polling cu after(), deci callback-urile pot modifica widget-uri direct.
+    """
+    
+    def __init__(self, widget,
+                 func: Callable,
+                 on_done: Callable,
+                 on_progress: Callable = None,
+                 on_error: Callable = None,
+                 on_cancel: Callable = None,
+                 poll_ms: int = 50):
+        self._widget = widget
+        self._func = func
+        self._on_done = on_done
+        self._on_progress = on_progress
+        self._on_error = on_error
+        self._on_cancel = on_cancel
+        self._poll_ms = poll_ms
+        
+        self._thread = None
+        self._progress = 0.0
+        self._reported_progress = None
+        self._result = None
+        self._error = None
+        self.cancel_event = threading.Event()
+    
+    @property
+    def running(self) -> bool:
+        """True cât timp thread-ul lucrează sau rezultatul nu a fost încă livrat"""
+        return self._thread is not None
+    
+    def start(self, *args, **kwargs):
+        """Pornește calculul; ignoră apelul dacă unul este deja în curs"""
+        if self.running:
+            return False
+        
+        self._progress = 0.0
+        self._reported_progress = None
+        self._result = None
+        self._error = None
+        self.cancel_event.clear()
+        
+        self._thread = threading.Thread(target=self._worker, args=args, kwargs=kwargs, daemon=True)
+        self._thread.start()
+        self._widget.after(self._poll_ms, self._poll)
+        return True
+    
+    def cancel(self):
+        """Cere oprirea calculului; on_cancel e apelat când thread-ul se termină"""
+        self.cancel_event.set()
+    
+    def _set_progress(self, value: float):
+        # Apelat din thread-ul de lucru - doar se memorează, UI-ul citește în _poll
+        self._progress = value
+    
+    def _worker(self, *args, **kwargs):
+        try:
+            self._result = self._func(*args, progress=self._set_progress,
+                                      cancel_event=self.cancel_event, **kwargs)
+        except Exception as e:
+            self._error = e
+    
+    def _poll(self):
+        if self._on_progress and self._progress != self._reported_progress:
+            self._reported_progress = self._progress
+            self._on_progress(self._progress)
+        
+        if self._thread.is_alive():
+            self._widget.after(self._poll_ms, self._poll)
+            return
+        
+        self._thread = None
+        if self.cancel_event.is_set():
+            if self._on_cancel:
+                self._on_cancel()
+        elif self._error is not None:
+            if self._on_error:
+                self._on_error(self._error)
+        else:
+            self._on_done(self._result)
+
+
+# ═══════════════════════════════════════════════════════════════
+# ⏱️ Debouncer - Coalescență apeluri repetate prin after()
+# ═══════════════════════════════════════════════════════════════
+
+class Debouncer:
+    """Amână și comasează apelurile repetate ale unei funcții.
+
+    Fiecare trigger() reprogramează apelul la delay_ms după ultima schimbare;
+    dacă schimbările nu se opresc (drag pe slider), max_interval_ms garantează
+    cel puțin un apel la acest interval. Funcția rulează pe thread-ul Tk și
+    citește parametrii curenți, deci se calculează doar ultimul set de valori.
+    max_interval_ms trebuie să fie mai mare decât delay_ms; altfel apelul ar
+    veni mereu după max_interval_ms și debounce-ul nu s-ar mai aplica.
+    """
+    
+    def __init__(self, widget,
+                 func: Callable,
+                 delay_ms: int = 150,
+                 max_interval_ms: int = None):
+        if max_interval_ms is not None and max_interval_ms <= delay_ms:
+            raise ValueError("max_interval_ms trebuie să fie mai mare decât delay_ms")
+        self._widget = widget
+        self._func = func
+        self._delay_ms = delay_ms
+        self._max_interval_ms = max_interval_ms
+        self._job = None
+        self._burst_start = None
+    
+    @property
+    def pending(self) -> bool:
+        return self._job is not None
+    
+    def trigger(self, *_):
+        """Semnalează o schimbare; acceptă și ignoră argumentele callback-urilor Tk"""
+        now = time.monotonic()
+        if self._job is not None:
+            self._widget.after_cancel(self._job)
+        else:
+            self._burst_start = now
+        
+        wait = self._delay_ms
+        if self._max_interval_ms is not None:
+            elapsed = (now - self._burst_start) * 1000
+            wait = min(wait, max(0, int(self._max_interval_ms - elapsed)))
+        self._job = self._widget.after(wait, self._fire)
+    
+    def flush(self):
+        """Execută imediat apelul în așteptare, dacă există"""
+        if self._job is not None:
+            self._widget.after_cancel(self._job)
+            self._fire()
+    
+    def cancel(self):
+        """Renunță la apelul în așteptare"""
+        if self._job is not None:
+            self._widget.after_cancel(self._job)
+        self._job = None
+        self._burst_start = None
+    
+    def _fire(self):
+        self._job = None
+        self._burst_start = None
+        self._func()
+
+
 # ═══════════════════════════════════════════════════════════════
 # 🧪 TEST
 # ═══════════════════════════════════════════════════════════════